@@ -53,8 +53,9 @@ def create_app(settings: "Settings | None" = None, app_settings: "AppSettings |
 
     app.container = container
 
-    # Configure CORS
-    CORS(app, origins=settings.cors_origins)
+    # Configure CORS for the API only; health and metrics endpoints are never
+    # called cross-origin. Browsers may cache preflight results for 30 minutes.
+    CORS(app, resources=r"/api/*", origins=settings.cors_origins, max_age=1800)
 
     # Initialize correlation ID tracking
     from app.utils import _init_request_id
@@ -91,6 +92,7 @@ def create_app(settings: "Settings | None" = None, app_settings: "AppSettings |
     from app.utils.flask_error_handlers import (
         register_business_error_handlers,
         register_core_error_handlers,
+        resolve_error_handler_subclasses,
     )
 
     register_core_error_handlers(app)
@@ -100,6 +102,10 @@ def create_app(settings: "Settings | None" = None, app_settings: "AppSettings |
     from app.startup import register_error_handlers
 
     register_error_handlers(app)
+
+    # Pre-resolve handlers for exception subclasses without their own handler
+    resolve_error_handler_subclasses(app)
+
     health_service = container.health_service()
 
     # Register SSE Gateway readiness check with HealthService
@@ -156,6 +162,10 @@ def create_app(settings: "Settings | None" = None, app_settings: "AppSettings |
     from app.api.testing_auth import testing_auth_bp
     app.register_blueprint(testing_auth_bp)
 
+    # Snapshot @public endpoints for the authentication hook
+    from app.utils.auth import register_public_endpoints
+    register_public_endpoints(app)
+
     # --- Role-based access startup hooks ---
     # Validate @allow_roles decorators against configured roles (fail fast on typos)
     if settings.oidc_enabled:
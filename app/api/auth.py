@@ -19,6 +19,7 @@ from app.services.container import ServiceContainer
 from app.services.oidc_client_service import OidcClientService
 from app.services.testing_service import TestingService
 from app.utils.auth import (
+    clear_auth_cookies,
     deserialize_auth_state,
     get_auth_context,
     get_cookie_kwargs,
@@ -369,8 +370,6 @@ def logout(
     response = make_response(redirect(final_redirect_url))
 
     # Clear auth cookies
-    cookie_kw = get_cookie_kwargs(config)
-    for name in (config.oidc_cookie_name, config.oidc_refresh_cookie_name, "id_token"):
-        response.set_cookie(name, "", max_age=0, **cookie_kw)
+    clear_auth_cookies(response, config)
 
     return response
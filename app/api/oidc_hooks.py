@@ -12,6 +12,7 @@ from app.services.oidc_client_service import OidcClientService
 from app.services.testing_service import TestingService
 from app.utils.auth import (
     authenticate_request,
+    clear_auth_cookies,
     get_cookie_kwargs,
     get_token_expiry_seconds,
 )
@@ -57,15 +58,15 @@ def register_oidc_hooks(api_bp: Blueprint) -> None:
         from app.services.auth_service import AuthContext
         from app.utils.auth import check_authorization
 
-        # Get the actual view function from Flask's view_functions
-        endpoint = request.endpoint
-        actual_func = current_app.view_functions.get(endpoint) if endpoint else None
-
         # Skip authentication for public endpoints (check first to avoid unnecessary work)
-        if actual_func and getattr(actual_func, "is_public", False):
+        endpoint = request.endpoint
+        if endpoint in current_app.extensions["public_endpoints"]:
             logger.debug("Public endpoint - skipping authentication")
             return None
 
+        # Get the actual view function from Flask's view_functions
+        actual_func = current_app.view_functions.get(endpoint) if endpoint else None
+
         # In testing mode, check for test session token (bypasses OIDC)
         if config.is_testing:
             token = request.cookies.get(config.oidc_cookie_name)
@@ -79,7 +80,7 @@ def register_oidc_hooks(api_bp: Blueprint) -> None:
                         subject=test_session.subject,
                         email=test_session.email,
                         name=test_session.name,
-                        roles=expanded_roles,
+                        roles=frozenset(expanded_roles),
                     )
                     g.auth_context = auth_context
                     try:
@@ -128,7 +129,7 @@ def register_oidc_hooks(api_bp: Blueprint) -> None:
 
         # Check if we need to clear cookies (refresh failed)
         if getattr(g, "clear_auth_cookies", False):
-            _clear_auth_cookies(response, config)
+            clear_auth_cookies(response, config)
             return response
 
         # Check if we have pending tokens from a refresh
@@ -142,7 +143,7 @@ def register_oidc_hooks(api_bp: Blueprint) -> None:
                 refresh_max_age = get_token_expiry_seconds(pending.refresh_token)
                 if refresh_max_age is None:
                     logger.error("Refreshed token missing 'exp' claim — clearing auth cookies")
-                    _clear_auth_cookies(response, config)
+                    clear_auth_cookies(response, config)
                     return response
 
             # Set new access token cookie
@@ -171,9 +172,3 @@ def register_oidc_hooks(api_bp: Blueprint) -> None:
 
     api_bp.register_blueprint(auth_bp)  # type: ignore[attr-defined]
 
-
-def _clear_auth_cookies(response: Response, config: Settings) -> None:
-    """Clear all auth cookies on the response."""
-    cookie_kw = get_cookie_kwargs(config)
-    for name in (config.oidc_cookie_name, config.oidc_refresh_cookie_name, "id_token"):
-        response.set_cookie(name, "", max_age=0, **cookie_kw)
@@ -1,5 +1,6 @@
 """SSE Gateway callback endpoint for handling connect/disconnect notifications."""
 
+import hmac
 import logging
 from urllib.parse import parse_qs, urlparse
 
@@ -40,7 +41,11 @@ def _authenticate_callback(secret_from_query: str | None, settings: Settings) ->
         logger.error("SSE_CALLBACK_SECRET not configured in production mode")
         return False
 
-    return secret_from_query == expected_secret
+    if secret_from_query is None:
+        return False
+
+    # Constant-time comparison so the secret can't be recovered by timing
+    return hmac.compare_digest(secret_from_query.encode(), expected_secret.encode())
 
 
 def _extract_token_from_headers(headers: dict[str, str], cookie_name: str) -> str | None:
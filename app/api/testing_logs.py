@@ -8,8 +8,12 @@ from typing import Any
 from flask import Blueprint, request
 
 from app.utils import ensure_request_id_from_query, get_current_correlation_id
-from app.utils.log_capture import LogCaptureHandler
-from app.utils.sse_utils import create_sse_response, format_sse_event
+from app.utils.log_capture import LogCaptureHandler, LogEvent
+from app.utils.sse_utils import (
+    SSE_MAX_CHUNK_BYTES,
+    create_sse_response,
+    format_sse_event,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -41,13 +45,13 @@ def stream_logs() -> Any:
     def log_stream() -> Any:
         correlation_id = get_current_correlation_id()
 
-        event_queue: Queue[tuple[str, dict[str, Any]]] = Queue()
+        event_queue: Queue[LogEvent] = Queue()
 
         class QueueLogClient:
-            def __init__(self, queue: Queue[tuple[str, dict[str, Any]]]):
+            def __init__(self, queue: Queue[LogEvent]):
                 self.queue = queue
 
-            def put(self, event_data: tuple[str, dict[str, Any]]) -> None:
+            def put(self, event_data: LogEvent) -> None:
                 self.queue.put(event_data)
 
         client = QueueLogClient(event_queue)
@@ -66,16 +70,25 @@ def stream_logs() -> Any:
             while True:
                 try:
                     timeout = 0.25 if shutdown_requested else 1.0
-                    event_type, event_data = event_queue.get(timeout=timeout)
-
-                    if correlation_id and "correlation_id" not in event_data:
-                        event_data["correlation_id"] = correlation_id
-
-                    yield format_sse_event(event_type, event_data)
-
-                    if event_type == "connection_close":
-                        shutdown_requested = True
-                        continue
+                    event = event_queue.get(timeout=timeout)
+
+                    # Coalesce events that are already queued into one chunk so
+                    # bursts of log records don't turn into one write per record.
+                    buffer = bytearray()
+                    while True:
+                        buffer += event.to_sse(correlation_id)
+
+                        if event.event_type == "connection_close":
+                            shutdown_requested = True
+                            break
+                        if len(buffer) >= SSE_MAX_CHUNK_BYTES:
+                            break
+                        try:
+                            event = event_queue.get_nowait()
+                        except Empty:
+                            break
+
+                    yield bytes(buffer)
 
                 except Empty:
                     if shutdown_requested:
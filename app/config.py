@@ -301,7 +301,11 @@ class Settings(BaseModel):
             secret_key=env.SECRET_KEY,
             flask_env=env.FLASK_ENV,
             debug=env.DEBUG,
-            cors_origins=env.CORS_ORIGINS,
+            # A wildcard allows every origin, so nothing else needs to be kept;
+            # otherwise dedup while preserving order
+            cors_origins=(
+                ["*"] if "*" in env.CORS_ORIGINS else list(dict.fromkeys(env.CORS_ORIGINS))
+            ),
             task_max_workers=env.TASK_MAX_WORKERS,
             task_timeout_seconds=env.TASK_TIMEOUT_SECONDS,
             task_cleanup_interval_seconds=env.TASK_CLEANUP_INTERVAL_SECONDS,
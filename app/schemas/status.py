@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class StatusState(str, Enum):
@@ -14,6 +14,9 @@ class StatusState(str, Enum):
 
 
 class StatusPayload(BaseModel):
+    # Frozen so one payload can safely be shared between tab slots
+    model_config = ConfigDict(frozen=True)
+
     state: StatusState = Field(description="Current state of the tab")
     message: str | None = Field(default=None, description="Optional diagnostic message")
 
@@ -1,7 +1,10 @@
 """JWT validation service with JWKS discovery and caching."""
 
+import hashlib
 import logging
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any
 
@@ -31,21 +34,31 @@ JWKS_REFRESH_TOTAL = Counter(
 
 logger = logging.getLogger(__name__)
 
+# Successful validations are cached per token for at most this many seconds
+# (never beyond the token's own expiry), bounded to the most recent entries.
+_TOKEN_CACHE_TTL_SECONDS = 300
+_TOKEN_CACHE_MAX_ENTRIES = 2048
 
-@dataclass
+
+@dataclass(frozen=True)
 class AuthContext:
-    """Authentication context extracted from validated JWT token."""
+    """Authentication context extracted from validated JWT token.
+
+    Immutable because validated contexts are cached and shared between requests.
+    """
 
     subject: str  # JWT "sub" claim
     email: str | None  # JWT "email" claim
     name: str | None  # JWT "name" claim
-    roles: set[str]  # Combined roles from realm_access and resource_access
+    roles: frozenset[str]  # Combined roles from realm_access and resource_access
 
 
 class AuthService:
     """Service for JWT validation with JWKS discovery and caching.
 
-    This is a singleton service that caches JWKS keys with a 5-minute TTL.
+    This is a singleton service that caches JWKS keys with a 1-hour TTL;
+    tokens signed with an unknown key ID trigger an immediate refetch, so key
+    rotation does not wait for the TTL.
     Thread-safe for concurrent token validation.
 
     Role-based access control:
@@ -154,6 +167,10 @@ class AuthService:
                 implied.add(read_role)
             self._hierarchy_map[admin_role] = implied
 
+        # Validated token cache: blake2b(token) -> (context, wall-clock deadline)
+        self._token_cache: OrderedDict[bytes, tuple[AuthContext, float]] = OrderedDict()
+        self._token_cache_lock = threading.Lock()
+
         # JWKS client instance (initialized once if OIDC enabled)
         self._jwks_client: PyJWKClient | None = None
         self._jwks_uri: str | None = None
@@ -175,7 +192,7 @@ class AuthService:
                 self._jwks_client = PyJWKClient(
                     self._jwks_uri,
                     cache_keys=True,
-                    lifespan=300,  # 5 minutes in seconds
+                    lifespan=3600,  # 1 hour in seconds
                 )
                 logger.info("Initialized JWKS client with URI: %s", self._jwks_uri)
 
@@ -185,6 +202,15 @@ class AuthService:
                 logger.error("Failed to initialize JWKS client: %s", str(e))
                 JWKS_REFRESH_TOTAL.labels(trigger="startup", status="failed").inc()
                 raise
+
+            # Pre-warm the key set so the first request doesn't pay the fetch.
+            # Non-fatal: the client fetches lazily on first use if this fails.
+            try:
+                self._jwks_client.get_jwk_set()
+                JWKS_REFRESH_TOTAL.labels(trigger="prewarm", status="success").inc()
+            except Exception as e:
+                logger.warning("Failed to pre-warm JWKS cache: %s", str(e))
+                JWKS_REFRESH_TOTAL.labels(trigger="prewarm", status="failed").inc()
         else:
             logger.info("AuthService initialized with OIDC disabled")
 
@@ -297,7 +323,9 @@ class AuthService:
         """Validate JWT token and extract authentication context.
 
         Validates token signature, expiration, issuer, and audience.
-        Extracts user information and roles from token claims.
+        Extracts user information and roles from token claims. Successful
+        results are cached briefly so repeat requests with the same token
+        skip signature verification; failures are never cached.
 
         Args:
             token: JWT token string
@@ -310,6 +338,13 @@ class AuthService:
         """
         start_time = time.perf_counter()
 
+        cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        cached = self._get_cached_context(cache_key)
+        if cached is not None:
+            AUTH_VALIDATION_TOTAL.labels(status="success").inc()
+            AUTH_VALIDATION_DURATION_SECONDS.observe(max(time.perf_counter() - start_time, 0.0))
+            return cached
+
         try:
             # Ensure JWKS client is initialized
             if not self._jwks_client:
@@ -348,19 +383,21 @@ class AuthService:
             AUTH_VALIDATION_TOTAL.labels(status="success").inc()
             AUTH_VALIDATION_DURATION_SECONDS.observe(max(duration, 0.0))
 
-            logger.info(
+            logger.debug(
                 "Token validated successfully for subject=%s email=%s roles=%s",
                 subject,
                 email,
                 roles,
             )
 
-            return AuthContext(
+            auth_context = AuthContext(
                 subject=subject,
                 email=email,
                 name=name,
-                roles=roles,
+                roles=frozenset(roles),
             )
+            self._cache_context(cache_key, auth_context, payload.get("exp"))
+            return auth_context
 
         except jwt.ExpiredSignatureError as e:
             duration = time.perf_counter() - start_time
@@ -408,6 +445,33 @@ class AuthService:
                 f"Token validation failed: {str(e)}"
             ) from e
 
+    def _get_cached_context(self, cache_key: bytes) -> AuthContext | None:
+        """Return a cached AuthContext if present and not yet expired."""
+        with self._token_cache_lock:
+            entry = self._token_cache.get(cache_key)
+            if entry is None:
+                return None
+            auth_context, deadline = entry
+            if time.time() >= deadline:
+                del self._token_cache[cache_key]
+                return None
+            self._token_cache.move_to_end(cache_key)
+            return auth_context
+
+    def _cache_context(
+        self, cache_key: bytes, auth_context: AuthContext, exp: Any
+    ) -> None:
+        """Cache a successful validation until the TTL or token expiry, whichever is first."""
+        deadline = time.time() + _TOKEN_CACHE_TTL_SECONDS
+        if isinstance(exp, int | float):
+            deadline = min(deadline, float(exp))
+
+        with self._token_cache_lock:
+            self._token_cache[cache_key] = (auth_context, deadline)
+            self._token_cache.move_to_end(cache_key)
+            while len(self._token_cache) > _TOKEN_CACHE_MAX_ENTRIES:
+                self._token_cache.popitem(last=False)
+
     def _extract_roles(self, payload: dict[str, Any], audience: str | None) -> set[str]:
         """Extract roles from JWT claims.
 
@@ -98,7 +98,6 @@ class ServiceContainer(containers.DeclarativeContainer):
         task_timeout=config.provided.task_timeout_seconds,
         cleanup_interval=config.provided.task_cleanup_interval_seconds,
     )
-    register_for_background_startup(lambda c: c.task_service().startup())
 
     # Frontend version service - SSE version notifications
     frontend_version_service = providers.Singleton(
@@ -333,7 +333,7 @@ class SSEConnectionManager:
     def send_event(
         self,
         request_id: str | None,
-        event_data: dict[str, Any],
+        event_data: dict[str, Any] | str,
         event_name: str,
         service_type: str,
         target_subject: str | None = None,
@@ -342,7 +342,8 @@ class SSEConnectionManager:
 
         Args:
             request_id: Request identifier for targeted send, or None for broadcast
-            event_data: Event payload (will be JSON-serialized)
+            event_data: Event payload (JSON-serialized once, shared by all recipients),
+                or an already-serialized JSON string which is sent as-is
             event_name: SSE event name
             service_type: Service type for metrics ("task" or "version")
             target_subject: When broadcasting (request_id=None), restrict delivery
@@ -352,6 +353,9 @@ class SSEConnectionManager:
         Returns:
             True if event sent successfully to at least one connection, False otherwise
         """
+        data = event_data if isinstance(event_data, str) else json.dumps(event_data)
+        event = SSEGatewayEventData(name=event_name, data=data)
+
         # Broadcast mode: send to all (or subject-filtered) active connections
         if request_id is None:
             with self._lock:
@@ -380,7 +384,7 @@ class SSEConnectionManager:
             # Send to each connection serially
             success_count = 0
             for req_id, token in tokens_to_send:
-                if self._send_event_to_token(token, event_data, event_name, service_type, req_id):
+                if self._send_event_to_token(token, event, service_type, req_id):
                     success_count += 1
 
             logger.debug(
@@ -405,13 +409,12 @@ class SSEConnectionManager:
 
             token = conn_info["token"]
 
-        return self._send_event_to_token(token, event_data, event_name, service_type, request_id)
+        return self._send_event_to_token(token, event, service_type, request_id)
 
     def _send_event_to_token(
         self,
         token: str,
-        event_data: dict[str, Any],
-        event_name: str,
+        event: SSEGatewayEventData,
         service_type: str,
         request_id: str | None = None
     ) -> bool:
@@ -419,8 +422,7 @@ class SSEConnectionManager:
 
         Args:
             token: Gateway connection token
-            event_data: Event payload
-            event_name: SSE event name
+            event: Event with its already-serialized payload
             service_type: Service type for metrics
             request_id: Request ID for logging (optional)
 
@@ -430,11 +432,6 @@ class SSEConnectionManager:
         start_time = perf_counter()
 
         try:
-            # Format event payload
-            event = SSEGatewayEventData(
-                name=event_name,
-                data=json.dumps(event_data)
-            )
             send_request = SSEGatewaySendRequest(
                 token=token,
                 event=event,
@@ -480,7 +477,7 @@ class SSEConnectionManager:
                 "Sent event to SSE Gateway",
                 extra={
                     "request_id": request_id,
-                    "event_name": event_name,
+                    "event_name": event.name,
                 }
             )
             SSE_GATEWAY_EVENTS_SENT_TOTAL.labels(service=service_type, status="success").inc()
@@ -10,6 +10,10 @@ from app.services.sse_connection_manager import SSEConnectionManager
 
 logger = logging.getLogger(__name__)
 
+# Every tab starts out running. StatusPayload is frozen, so the tabs can share
+# a single instance.
+_INITIAL_STATUS = StatusPayload(state=StatusState.RUNNING)
+
 
 class TabStatusService:
     """Publishes per-tab status updates via SSE Gateway."""
@@ -17,9 +21,7 @@ class TabStatusService:
     def __init__(self, config_service: ConfigService, sse_connection_manager: SSEConnectionManager) -> None:
         self._sse = sse_connection_manager
         tab_count = config_service.tab_count()
-        self._last: list[StatusPayload] = [
-            StatusPayload(state=StatusState.RUNNING) for _ in range(tab_count)
-        ]
+        self._last: list[StatusPayload] = [_INITIAL_STATUS] * tab_count
         self._sse.register_on_connect(self._on_client_connect)
         logger.info("TabStatusService initialised with %d tabs", tab_count)
 
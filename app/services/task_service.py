@@ -1,8 +1,9 @@
 import logging
+import queue
 import threading
+import time
 import traceback
 import uuid
-from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from typing import Any
 
@@ -30,10 +31,19 @@ ACTIVE_TASKS_AT_SHUTDOWN = Gauge(
 
 logger = logging.getLogger(__name__)
 
+# Queued unit of work: (task_id, task, kwargs, caller_subject); None stops a worker
+_WorkItem = tuple[str, BaseTask, dict[str, Any], str | None]
+
+# Task status groupings used for membership checks
+_TERMINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED})
+_ACTIVE_STATUSES = frozenset({TaskStatus.PENDING, TaskStatus.RUNNING})
+
 
 class TaskProgressHandle:
     """Implementation of ProgressHandle for sending updates via SSE."""
 
+    __slots__ = ("task_id", "sse_connection_manager", "target_subject", "progress", "progress_text")
+
     def __init__(
         self,
         task_id: str,
@@ -55,7 +65,13 @@ class TaskProgressHandle:
         self.send_progress(self.progress_text, value)
 
     def send_progress(self, text: str, value: float) -> None:
-        """Send both text and progress value update to connected clients."""
+        """Send both text and progress value update to connected clients.
+
+        Updates that neither change the text nor advance the value are dropped.
+        """
+        if text == self.progress_text and value <= self.progress:
+            return
+
         self.progress_text = text
         if value > self.progress:
             self.progress = value
@@ -70,10 +86,10 @@ class TaskProgressHandle:
             data=progress.model_dump()
         )
         try:
-            # Use mode='json' to serialize datetime to ISO format string
+            # Serialize straight to JSON with the model's compiled serializer
             self.sse_connection_manager.send_event(
                 None,  # None = broadcast
-                event.model_dump(mode='json'),
+                event.model_dump_json(),
                 event_name="task_event",
                 service_type="task",
                 target_subject=self.target_subject,
@@ -101,39 +117,35 @@ class TaskService:
             sse_connection_manager: SSEConnectionManager for SSE Gateway integration
             max_workers: Maximum number of concurrent tasks
             task_timeout: Task execution timeout in seconds
-            cleanup_interval: How often to clean up completed tasks in seconds
+            cleanup_interval: Seconds a finished task is kept; expired tasks are
+                swept at most this often, from task submission and completion
         """
         self.max_workers = max_workers
         self.task_timeout = task_timeout
-        self.cleanup_interval = cleanup_interval  # 10 minutes in seconds
+        self.cleanup_interval = cleanup_interval
         self.lifecycle_coordinator = lifecycle_coordinator
         self.sse_connection_manager = sse_connection_manager
         self._tasks: dict[str, TaskInfo] = {}
         self._task_instances: dict[str, BaseTask] = {}
-        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        # Monotonic end time per finished task, used only for cleanup ageing
+        self._end_times_ns: dict[str, int] = {}
+        # Persistent worker threads are spawned on demand, up to max_workers
+        self._work_queue: queue.SimpleQueue[_WorkItem | None] = queue.SimpleQueue()
+        self._workers: list[threading.Thread] = []
         self._lock = threading.RLock()
-        self._shutdown_event = threading.Event()
         self._shutting_down = False
         self._tasks_complete_event = threading.Event()
+        # Monotonic deadline for joining workers, set by the shutdown waiter
+        self._shutdown_deadline: float | None = None
 
         # Register with lifecycle coordinator
         self.lifecycle_coordinator.register_lifecycle_notification(self._on_lifecycle_event)
         self.lifecycle_coordinator.register_shutdown_waiter("TaskService", self._wait_for_tasks_completion)
 
-        # Cleanup thread is started later via startup()
-        self._cleanup_thread: threading.Thread | None = None
-
-        logger.info(f"TaskService initialized: max_workers={max_workers}, timeout={task_timeout}s, cleanup_interval={cleanup_interval}s")
-
-    def startup(self) -> None:
-        """Start the background cleanup thread.
+        # Monotonic time of the last sweep; sweeps piggyback on task activity
+        self._last_sweep_ns = time.monotonic_ns()
 
-        Called during app startup (after container construction). Separated
-        from __init__ so that test fixtures can create a TaskService without
-        spawning daemon threads.
-        """
-        self._cleanup_thread = threading.Thread(target=self._cleanup_worker, daemon=True)
-        self._cleanup_thread.start()
+        logger.info(f"TaskService initialized: max_workers={max_workers}, timeout={task_timeout}s, cleanup_interval={cleanup_interval}s (swept on task activity)")
 
     def start_task(
         self,
@@ -180,8 +192,13 @@ class TaskService:
             self._tasks[task_id] = task_info
             self._task_instances[task_id] = task
 
-            # Submit task to thread pool
-            self._executor.submit(self._execute_task, task_id, task, kwargs, caller_subject)
+            # Hand the task to the worker pool
+            self._work_queue.put_nowait((task_id, task, kwargs, caller_subject))
+            if len(self._workers) < self.max_workers:
+                self._start_worker()
+
+            # Amortize cleanup of expired tasks over task submissions
+            self._maybe_sweep_expired_locked()
 
         logger.info(f"Started task {task_id} of type {type(task).__name__}")
 
@@ -202,10 +219,10 @@ class TaskService:
             target_subject: When set, only deliver to connections with a
                 matching subject or the ``"local-user"`` sentinel.
         """
-        # Use mode='json' to serialize datetime to ISO format string
+        # Serialize straight to JSON with the model's compiled serializer
         success = self.sse_connection_manager.send_event(
             None,  # None = broadcast
-            event.model_dump(mode='json'),
+            event.model_dump_json(),
             event_name="task_event",
             service_type="task",
             target_subject=target_subject,
@@ -215,9 +232,12 @@ class TaskService:
             logger.debug(f"No active connections for broadcast: {event.event_type}")
 
     def get_task_status(self, task_id: str) -> TaskInfo | None:
-        """Get current status of a task."""
-        with self._lock:
-            return self._tasks.get(task_id)
+        """Get current status of a task.
+
+        Lock-free: stored TaskInfo objects are never mutated after insertion;
+        transitions replace them with updated copies in a single dict store.
+        """
+        return self._tasks.get(task_id)
 
     def cancel_task(self, task_id: str) -> bool:
         """
@@ -233,13 +253,16 @@ class TaskService:
             if not task_instance or not task_info:
                 return False
 
-            if task_info.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]:
+            if task_info.status in _TERMINAL_STATUSES:
                 return False
 
             # Request cancellation
             task_instance.cancel()
-            task_info.status = TaskStatus.CANCELLED
-            task_info.end_time = datetime.now(UTC)
+            self._tasks[task_id] = task_info.model_copy(update={
+                "status": TaskStatus.CANCELLED,
+                "end_time": datetime.now(UTC),
+            })
+            self._end_times_ns[task_id] = time.monotonic_ns()
 
             logger.info(f"Cancelled task {task_id}")
             return True
@@ -248,18 +271,40 @@ class TaskService:
         """Remove a completed task from registry."""
         with self._lock:
             task_info = self._tasks.get(task_id)
-            if not task_info or task_info.status not in [
-                TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED
-            ]:
+            if not task_info or task_info.status not in _TERMINAL_STATUSES:
                 return False
 
             # Clean up task data
             self._tasks.pop(task_id, None)
             self._task_instances.pop(task_id, None)
+            self._end_times_ns.pop(task_id, None)
 
             logger.debug(f"Removed completed task {task_id}")
             return True
 
+    def _start_worker(self) -> None:
+        """Spawn an additional worker thread. Must be called with the lock held."""
+        worker = threading.Thread(
+            target=self._worker_loop,
+            name=f"TaskWorker-{len(self._workers)}",
+            daemon=True,
+        )
+        self._workers.append(worker)
+        worker.start()
+
+    def _worker_loop(self) -> None:
+        """Run queued tasks until a stop sentinel is received.
+
+        Errors escaping a task are logged rather than propagated: a dead worker
+        still counts towards max_workers, so losing one would leave queued
+        tasks pending forever.
+        """
+        while (item := self._work_queue.get()) is not None:
+            try:
+                self._execute_task(*item)
+            except Exception:
+                logger.exception(f"Unhandled error in task worker while running task {item[0]}")
+
     def _execute_task(
         self,
         task_id: str,
@@ -273,7 +318,9 @@ class TaskService:
             with self._lock:
                 task_info = self._tasks.get(task_id)
                 if task_info:
-                    task_info.status = TaskStatus.RUNNING
+                    self._tasks[task_id] = task_info.model_copy(
+                        update={"status": TaskStatus.RUNNING}
+                    )
 
             # Send task started event
             start_event = TaskEvent(
@@ -295,16 +342,21 @@ class TaskService:
             with self._lock:
                 task_info = self._tasks.get(task_id)
                 if task_info and task_info.status != TaskStatus.CANCELLED:
-                    task_info.status = TaskStatus.COMPLETED
-                    task_info.end_time = datetime.now(UTC)
                     # Convert BaseModel to dict for storage
-                    task_info.result = result.model_dump() if result else None
+                    result_data = result.model_dump() if result else None
+                    self._tasks[task_id] = task_info.model_copy(update={
+                        "status": TaskStatus.COMPLETED,
+                        "end_time": datetime.now(UTC),
+                        "result": result_data,
+                    })
+                    self._end_times_ns[task_id] = time.monotonic_ns()
+                    self._maybe_sweep_expired_locked()
 
                     # Send completion event
                     completion_event = TaskEvent(
                         event_type=TaskEventType.TASK_COMPLETED,
                         task_id=task_id,
-                        data=result.model_dump() if result else None
+                        data=result_data
                     )
                     self._broadcast_task_event(
                         completion_event, target_subject=caller_subject
@@ -326,9 +378,13 @@ class TaskService:
             with self._lock:
                 task_info = self._tasks.get(task_id)
                 if task_info:
-                    task_info.status = TaskStatus.FAILED
-                    task_info.end_time = datetime.now(UTC)
-                    task_info.error = error_msg
+                    self._tasks[task_id] = task_info.model_copy(update={
+                        "status": TaskStatus.FAILED,
+                        "end_time": datetime.now(UTC),
+                        "error": error_msg,
+                    })
+                    self._end_times_ns[task_id] = time.monotonic_ns()
+                    self._maybe_sweep_expired_locked()
 
             # Send failure event
             failure_event = TaskEvent(
@@ -344,62 +400,64 @@ class TaskService:
             # Check if this was the last task during shutdown
             self._check_tasks_complete()
 
-    def _cleanup_worker(self) -> None:
-        """Background worker that periodically cleans up completed tasks."""
-        while not self._shutdown_event.is_set():
-            try:
-                # Wait for cleanup interval or shutdown signal
-                if self._shutdown_event.wait(timeout=self.cleanup_interval):
-                    break
-
-                # Perform cleanup
-                self._cleanup_completed_tasks()
-
-            except Exception as e:
-                # Log error but continue cleanup loop
-                logger.error(f"Error during task cleanup: {e}", exc_info=True)
-
-    def _cleanup_completed_tasks(self) -> None:
-        """Remove completed tasks older than cleanup_interval."""
-        current_time = datetime.now(UTC)
-        tasks_to_remove = []
+    def _maybe_sweep_expired_locked(self) -> None:
+        """Sweep expired tasks if cleanup_interval has passed since the last sweep.
 
-        with self._lock:
-            for task_id, task_info in self._tasks.items():
-                # Only clean up completed, failed, or cancelled tasks
-                if task_info.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]:
-                    if task_info.end_time:
-                        # Calculate time since completion
-                        time_since_completion = (current_time - task_info.end_time).total_seconds()
-                        if time_since_completion >= self.cleanup_interval:
-                            tasks_to_remove.append(task_id)
-
-        # Remove old tasks
-        if tasks_to_remove:
-            logger.debug(f"Cleaning up {len(tasks_to_remove)} completed tasks")
-
-        for task_id in tasks_to_remove:
-            self.remove_completed_task(task_id)
+        Caller holds the lock.
+        """
+        now_ns = time.monotonic_ns()
+        if now_ns - self._last_sweep_ns >= self.cleanup_interval * 1_000_000_000:
+            self._sweep_expired_locked(now_ns)
+
+    def _sweep_expired_locked(self, now_ns: int) -> None:
+        """Remove finished tasks older than cleanup_interval. Caller holds the lock."""
+        self._last_sweep_ns = now_ns
+        threshold_ns = self.cleanup_interval * 1_000_000_000
+
+        # Only finished tasks have an end time recorded
+        expired = [
+            task_id for task_id, end_ns in self._end_times_ns.items()
+            if now_ns - end_ns >= threshold_ns
+        ]
+        if not expired:
+            return
+
+        logger.debug(f"Cleaning up {len(expired)} completed tasks")
+
+        for task_id in expired:
+            self._tasks.pop(task_id, None)
+            self._task_instances.pop(task_id, None)
+            del self._end_times_ns[task_id]
 
     def shutdown(self) -> None:
         """Shutdown the task service and cleanup resources."""
         logger.info("Shutting down TaskService...")
 
-        # Signal cleanup thread to stop
-        self._shutdown_event.set()
-        if self._cleanup_thread is not None and self._cleanup_thread.is_alive():
-            self._cleanup_thread.join(timeout=5.0)
-
-        self._executor.shutdown(wait=True)
+        # Stop workers once queued tasks have drained, then wait for them up to
+        # the graceful shutdown deadline (task_timeout if no deadline was set)
+        with self._lock:
+            workers = list(self._workers)
+            for _ in workers:
+                self._work_queue.put_nowait(None)
+        deadline = self._shutdown_deadline
+        if deadline is None:
+            deadline = time.monotonic() + self.task_timeout
+        for worker in workers:
+            worker.join(timeout=max(deadline - time.monotonic(), 0.0))
+
+        stuck = [worker.name for worker in workers if worker.is_alive()]
+        if stuck:
+            logger.warning(f"{len(stuck)} task workers still running at shutdown: {', '.join(stuck)}")
 
         with self._lock:
             active_tasks = sum(1 for t in self._tasks.values()
-                             if t.status in [TaskStatus.PENDING, TaskStatus.RUNNING])
+                             if t.status in _ACTIVE_STATUSES)
             if active_tasks > 0:
                 logger.warning(f"Shutting down with {active_tasks} active tasks")
 
             self._tasks.clear()
             self._task_instances.clear()
+            self._end_times_ns.clear()
 
         logger.info("TaskService shutdown complete")
 
@@ -427,6 +485,8 @@ class TaskService:
         Returns:
             True if all tasks completed, False if timeout
         """
+        self._shutdown_deadline = time.monotonic() + timeout
+
         with self._lock:
             active_count = self._get_active_task_count()
 
@@ -456,7 +516,7 @@ class TaskService:
         """
         return sum(
             1 for task in self._tasks.values()
-            if task.status in [TaskStatus.PENDING, TaskStatus.RUNNING]
+            if task.status in _ACTIVE_STATUSES
         )
 
     def _check_tasks_complete(self) -> None:
@@ -4,14 +4,136 @@ import html
 import io
 import logging
 import secrets
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 from textwrap import dedent
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PIL import Image, ImageFont
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Fixture markup is assembled and dedented once at import time; only the title
+# and preview image path vary per call and are substituted with format().
+_HTML_BANNER_MARKUP = dedent(
+    """
+    <div
+      id="deployment-notification"
+      class="deployment-notification w-full bg-blue-600 text-white px-4 py-3 text-center text-sm font-medium shadow-md"
+      data-testid="deployment-notification"
+    >
+      A new version of the app is available.
+      <button
+        type="button"
+        data-testid="deployment-notification-reload"
+        class="underline hover:no-underline font-semibold focus:outline-none focus:ring-2 focus:ring-blue-300 focus:ring-offset-2 focus:ring-offset-blue-600 rounded px-1"
+      >
+        Click reload to reload the app.
+      </button>
+    </div>
+    """
+).strip()
+
+_HTML_FIXTURE_TEMPLATE = dedent(
+    """
+    <!DOCTYPE html>
+    <html lang="en">
+      <head>
+        <meta charset="utf-8" />
+        <meta http-equiv="X-UA-Compatible" content="IE=edge" />
+        <meta name="viewport" content="width=device-width, initial-scale=1" />
+        <title>{safe_title}</title>
+        <meta name="description" content="Deterministic testing fixture" />
+        <meta property="og:title" content="{safe_title}" />
+        <meta property="og:type" content="article" />
+        <meta property="og:image" content="{preview_image_path}" />
+        <meta property="og:image:alt" content="Preview image for Playwright fixture" />
+        <meta name="twitter:card" content="summary_large_image" />
+        <meta name="twitter:title" content="{safe_title}" />
+        <meta name="twitter:image" content="{preview_image_path}" />
+        <link rel="icon" href="{preview_image_path}" />
+        <style>
+          body {{
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            margin: 0;
+            padding: 0;
+            background: #f5f7fa;
+            color: #1f2933;
+          }}
+          main {{
+            max-width: 720px;
+            margin: 3rem auto;
+            background: #ffffff;
+            padding: 2rem;
+            border-radius: 12px;
+            box-shadow: 0 10px 25px rgba(15, 23, 42, 0.1);
+          }}
+          h1 {{
+            margin-top: 0;
+            font-size: 2rem;
+            color: #111827;
+          }}
+          p {{
+            line-height: 1.6;
+            margin-bottom: 1rem;
+          }}
+          .meta {{
+            font-size: 0.875rem;
+            color: #4b5563;
+            margin-bottom: 2rem;
+          }}
+        </style>
+      </head>
+      <body>
+        <div id="__app">
+          {banner_markup}
+          <main>
+            <h1>{safe_title}</h1>
+            <div class="meta">Fixture generated for deterministic Playwright document ingestion.</div>
+            <p>
+              This page is served by the backend testing utilities. It exposes
+              predictable content for validating document ingestion, HTML metadata extraction, and banner
+              detection flows without relying on external services.
+            </p>
+            <p>
+              The associated preview image is hosted at <code>{preview_image_path}</code> and is referenced
+              via Open Graph and Twitter metadata.
+            </p>
+          </main>
+        </div>
+      </body>
+    </html>
+    """
+).strip()
+
+
+# The banner slot is filled once per variant; rendering is a single format().
+_HTML_FIXTURE_WITHOUT_BANNER = _HTML_FIXTURE_TEMPLATE.replace("{banner_markup}", "")
+_HTML_FIXTURE_WITH_BANNER = _HTML_FIXTURE_TEMPLATE.replace("{banner_markup}", _HTML_BANNER_MARKUP)
+
+
+# PIL is imported lazily so the dependency is only needed when fixture images
+# are actually requested; the font and blank canvas are loaded once and reused.
+@cache
+def _default_font() -> "ImageFont.ImageFont | ImageFont.FreeTypeFont":
+    from PIL import ImageFont
+
+    return ImageFont.load_default()
+
+
+@cache
+def _blank_image(width: int, height: int, color: str) -> "Image.Image":
+    from PIL import Image
+
+    return Image.new("RGB", (width, height), color=color)
+
+
+@dataclass(slots=True, frozen=True)
 class TestSession:
     """Represents a test authentication session."""
 
@@ -35,8 +157,14 @@ class TestingService:
     PREVIEW_IMAGE_QUERY = "Fixture+Preview"
     _PDF_ASSET_PATH = Path(__file__).resolve().parents[1] / "assets" / "fake-pdf.pdf"
 
-    # Class-level storage for test sessions (token -> session data)
-    _sessions: dict[str, TestSession] = {}
+    # Upper bound on retained test sessions; the least recently used is evicted
+    _MAX_SESSIONS = 10_000
+
+    # Class-level storage for test sessions (token -> session data), in LRU order
+    _sessions: OrderedDict[str, TestSession] = OrderedDict()
+
+    # Guards _sessions and _forced_auth_error across request threads
+    _sessions_lock = threading.Lock()
 
     # Forced error status for /api/auth/self (single-shot)
     _forced_auth_error: int | None = None
@@ -71,7 +199,10 @@ class TestingService:
             email=email,
             roles=roles or [],
         )
-        TestingService._sessions[token] = session
+        with TestingService._sessions_lock:
+            TestingService._sessions[token] = session
+            while len(TestingService._sessions) > TestingService._MAX_SESSIONS:
+                TestingService._sessions.popitem(last=False)
 
         logger.info(
             "Created test session: subject=%s name=%s email=%s roles=%s",
@@ -92,7 +223,11 @@ class TestingService:
         Returns:
             TestSession if found, None otherwise
         """
-        return TestingService._sessions.get(token)
+        with TestingService._sessions_lock:
+            session = TestingService._sessions.get(token)
+            if session is not None:
+                TestingService._sessions.move_to_end(token)
+            return session
 
     def clear_session(self, token: str) -> bool:
         """Clear a test session.
@@ -103,15 +238,16 @@ class TestingService:
         Returns:
             True if session was cleared, False if not found
         """
-        if token in TestingService._sessions:
-            del TestingService._sessions[token]
+        with TestingService._sessions_lock:
+            removed = TestingService._sessions.pop(token, None) is not None
+        if removed:
             logger.info("Cleared test session")
-            return True
-        return False
+        return removed
 
     def clear_all_sessions(self) -> None:
         """Clear all test sessions (for test isolation)."""
-        TestingService._sessions.clear()
+        with TestingService._sessions_lock:
+            TestingService._sessions.clear()
         logger.debug("Cleared all test sessions")
 
     def set_forced_auth_error(self, status_code: int) -> None:
@@ -120,7 +256,8 @@ class TestingService:
         Args:
             status_code: HTTP status code to return
         """
-        TestingService._forced_auth_error = status_code
+        with TestingService._sessions_lock:
+            TestingService._forced_auth_error = status_code
         logger.info("Set forced auth error: status=%d", status_code)
 
     def consume_forced_auth_error(self) -> int | None:
@@ -129,8 +266,9 @@ class TestingService:
         Returns:
             HTTP status code if set, None otherwise
         """
-        error = TestingService._forced_auth_error
-        TestingService._forced_auth_error = None
+        with TestingService._sessions_lock:
+            error = TestingService._forced_auth_error
+            TestingService._forced_auth_error = None
         if error:
             logger.info("Consumed forced auth error: status=%d", error)
         return error
@@ -139,28 +277,25 @@ class TestingService:
 
     def create_fake_image(self, text: str) -> bytes:
         """Create a 400x100 PNG with centered text on a light blue background."""
-        from PIL import Image, ImageDraw, ImageFont
+        from PIL import ImageDraw
 
-        font = ImageFont.load_default()
-
-        image = Image.new(
-            "RGB",
-            (self.IMAGE_WIDTH, self.IMAGE_HEIGHT),
-            color=self.IMAGE_BACKGROUND_COLOR,
-        )
+        image = _blank_image(
+            self.IMAGE_WIDTH, self.IMAGE_HEIGHT, self.IMAGE_BACKGROUND_COLOR
+        ).copy()
 
         if text:
             draw = ImageDraw.Draw(image)
             draw.text(
                 (self.IMAGE_WIDTH / 2, self.IMAGE_HEIGHT / 2),
                 text,
-                font=font,
+                font=_default_font(),
                 fill=self.IMAGE_TEXT_COLOR,
                 anchor="mm",
             )
 
         buffer = io.BytesIO()
-        image.save(buffer, format="PNG")
+        # Fixture images favour encode speed over size.
+        image.save(buffer, format="PNG", compress_level=1, optimize=False)
         return buffer.getvalue()
 
     def get_pdf_fixture(self) -> bytes:
@@ -171,100 +306,8 @@ class TestingService:
 
     def render_html_fixture(self, title: str, include_banner: bool = False) -> str:
         """Render deterministic HTML content for Playwright fixtures."""
-        safe_title = html.escape(title)
-        preview_image_path = f"/api/testing/content/image?text={self.PREVIEW_IMAGE_QUERY}"
-
-        banner_markup = ""
-        if include_banner:
-            banner_markup = dedent(
-                """
-                <div
-                  id="deployment-notification"
-                  class="deployment-notification w-full bg-blue-600 text-white px-4 py-3 text-center text-sm font-medium shadow-md"
-                  data-testid="deployment-notification"
-                >
-                  A new version of the app is available.
-                  <button
-                    type="button"
-                    data-testid="deployment-notification-reload"
-                    class="underline hover:no-underline font-semibold focus:outline-none focus:ring-2 focus:ring-blue-300 focus:ring-offset-2 focus:ring-offset-blue-600 rounded px-1"
-                  >
-                    Click reload to reload the app.
-                  </button>
-                </div>
-                """
-            ).strip()
-
-        html_document = dedent(
-            f"""
-            <!DOCTYPE html>
-            <html lang="en">
-              <head>
-                <meta charset="utf-8" />
-                <meta http-equiv="X-UA-Compatible" content="IE=edge" />
-                <meta name="viewport" content="width=device-width, initial-scale=1" />
-                <title>{safe_title}</title>
-                <meta name="description" content="Deterministic testing fixture" />
-                <meta property="og:title" content="{safe_title}" />
-                <meta property="og:type" content="article" />
-                <meta property="og:image" content="{preview_image_path}" />
-                <meta property="og:image:alt" content="Preview image for Playwright fixture" />
-                <meta name="twitter:card" content="summary_large_image" />
-                <meta name="twitter:title" content="{safe_title}" />
-                <meta name="twitter:image" content="{preview_image_path}" />
-                <link rel="icon" href="{preview_image_path}" />
-                <style>
-                  body {{
-                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                    margin: 0;
-                    padding: 0;
-                    background: #f5f7fa;
-                    color: #1f2933;
-                  }}
-                  main {{
-                    max-width: 720px;
-                    margin: 3rem auto;
-                    background: #ffffff;
-                    padding: 2rem;
-                    border-radius: 12px;
-                    box-shadow: 0 10px 25px rgba(15, 23, 42, 0.1);
-                  }}
-                  h1 {{
-                    margin-top: 0;
-                    font-size: 2rem;
-                    color: #111827;
-                  }}
-                  p {{
-                    line-height: 1.6;
-                    margin-bottom: 1rem;
-                  }}
-                  .meta {{
-                    font-size: 0.875rem;
-                    color: #4b5563;
-                    margin-bottom: 2rem;
-                  }}
-                </style>
-              </head>
-              <body>
-                <div id="__app">
-                  {banner_markup}
-                  <main>
-                    <h1>{safe_title}</h1>
-                    <div class="meta">Fixture generated for deterministic Playwright document ingestion.</div>
-                    <p>
-                      This page is served by the backend testing utilities. It exposes
-                      predictable content for validating document ingestion, HTML metadata extraction, and banner
-                      detection flows without relying on external services.
-                    </p>
-                    <p>
-                      The associated preview image is hosted at <code>{preview_image_path}</code> and is referenced
-                      via Open Graph and Twitter metadata.
-                    </p>
-                  </main>
-                </div>
-              </body>
-            </html>
-            """
-        ).strip()
-
-        return html_document
+        template = _HTML_FIXTURE_WITH_BANNER if include_banner else _HTML_FIXTURE_WITHOUT_BANNER
+        return template.format(
+            safe_title=html.escape(title),
+            preview_image_path=f"/api/testing/content/image?text={self.PREVIEW_IMAGE_QUERY}",
+        )
@@ -1,26 +1,36 @@
 """Utility functions and helpers."""
 
 import uuid
+from contextvars import ContextVar
 
-from flask import g, has_request_context, request
+from flask import has_request_context, request
+
+# Set for the duration of each request; a ContextVar read is much cheaper
+# than checking for a request context and going through the ``g`` proxy.
+_correlation_id: ContextVar[str | None] = ContextVar("correlation_id", default=None)
 
 
 def get_current_correlation_id() -> str | None:
     """Get the current request's correlation ID."""
-    if not has_request_context():
-        return None
-    return getattr(g, "correlation_id", None)
+    return _correlation_id.get()
 
 
 def _init_request_id(app):  # type: ignore[no-untyped-def]
-    """Register before_request handler to set correlation ID."""
+    """Register request handlers to set and clear the correlation ID.
+
+    Generated IDs are 32-character hex strings (a UUID4 without hyphens).
+    """
 
     @app.before_request
     def set_request_id() -> None:
-        g.correlation_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
+        _correlation_id.set(request.headers.get("X-Request-ID") or uuid.uuid4().hex)
+
+    @app.teardown_request
+    def clear_request_id(exc: BaseException | None) -> None:
+        _correlation_id.set(None)
 
 
 def ensure_request_id_from_query(request_id: str | None) -> None:
     """Set correlation ID from query parameter for SSE streams."""
     if request_id and has_request_context():
-        g.correlation_id = request_id
+        _correlation_id.set(request_id)
@@ -1,15 +1,19 @@
 """Authentication utilities for OIDC integration."""
 
+import base64
+import hashlib
+import json
 import logging
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from typing import Any
 from urllib.parse import urlparse
 
-import jwt
 from cryptography.fernet import Fernet, InvalidToken
-from flask import g, request
+from flask import Response, g, request
+from werkzeug.http import dump_cookie
 
 from app.config import Settings
 from app.exceptions import (
@@ -23,7 +27,7 @@ from app.services.oidc_client_service import AuthState, OidcClientService
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PendingTokenRefresh:
     """Tokens to be set on response after successful refresh."""
 
@@ -35,7 +39,8 @@ class PendingTokenRefresh:
 def get_token_expiry_seconds(token: str) -> int | None:
     """Extract remaining lifetime from a JWT token's exp claim.
 
-    Decodes the token without signature verification (we just need the exp claim).
+    Reads the payload segment directly, without signature verification (we
+    just need the exp claim), which avoids a full PyJWT decode per call.
 
     Args:
         token: JWT token string
@@ -43,21 +48,26 @@ def get_token_expiry_seconds(token: str) -> int | None:
     Returns:
         Seconds until expiration, or None if token is not a JWT or has no exp claim
     """
+    parts = token.split(".")
+    if len(parts) != 3:
+        # Not a JWT (opaque token)
+        return None
+
     try:
-        # Decode without verification - we only need the payload
-        payload = jwt.decode(token, options={"verify_signature": False})
-        exp = payload.get("exp")
-        if exp is None:
-            return None
-
-        # time.time() is correct here: exp is an absolute Unix timestamp
-        remaining = int(exp - time.time())
-        return max(remaining, 0)  # Don't return negative
-
-    except jwt.DecodeError:
-        # Not a valid JWT (opaque token) - return None
+        segment = parts[1]
+        payload = json.loads(base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4)))
+    except ValueError:
+        # Malformed base64 or JSON - treat as opaque
+        return None
+
+    exp = payload.get("exp") if isinstance(payload, dict) else None
+    if not isinstance(exp, int | float):
         return None
 
+    # time.time() is correct here: exp is an absolute Unix timestamp
+    remaining = int(exp - time.time())
+    return max(remaining, 0)  # Don't return negative
+
 
 def public(func: Callable[..., Any]) -> Callable[..., Any]:
     """Decorator to mark an endpoint as publicly accessible (no authentication required).
@@ -187,16 +197,17 @@ def check_authorization(
     required_roles: set[str] = required if isinstance(required, set) else {required}
 
     # Check if user has at least one of the required roles
-    if auth_context.roles & required_roles:
-        logger.debug(
-            "User authorized: has %s, requires one of %s",
-            auth_context.roles & required_roles,
-            required_roles,
-        )
+    if not required_roles.isdisjoint(auth_context.roles):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "User authorized: has %s, requires one of %s",
+                auth_context.roles & required_roles,
+                required_roles,
+            )
         return
 
     # Blanket 403 if user has no recognized role at all
-    if not (auth_context.roles & auth_service.configured_roles):
+    if auth_context.roles.isdisjoint(auth_service.configured_roles):
         logger.debug(
             "No recognized role: user_roles=%s, configured_roles=%s, required_roles=%s",
             auth_context.roles,
@@ -250,7 +261,7 @@ def authenticate_request(
             auth_context = auth_service.validate_token(access_token)
             g.auth_context = auth_context
             check_authorization(auth_context, auth_service, http_method, view_func)
-            logger.info(
+            logger.debug(
                 "Request authenticated: subject=%s email=%s roles=%s",
                 auth_context.subject,
                 auth_context.email,
@@ -319,14 +330,21 @@ def _derive_fernet_key(secret_key: str) -> bytes:
     Returns:
         32-byte base64-encoded key suitable for Fernet
     """
-    import base64
-    import hashlib
-
     # SHA-256 produces 32 bytes, which is what Fernet expects (after base64 encoding)
     raw = hashlib.sha256(secret_key.encode()).digest()
     return base64.urlsafe_b64encode(raw)
 
 
+@lru_cache(maxsize=4)
+def _get_fernet(secret_key: str) -> Fernet:
+    """Return a Fernet instance for the secret key, reused across requests.
+
+    Fernet holds only the derived signing and encryption keys, so a single
+    instance can be shared between threads.
+    """
+    return Fernet(_derive_fernet_key(secret_key))
+
+
 def serialize_auth_state(auth_state: AuthState, secret_key: str) -> str:
     """Serialize and encrypt AuthState for use as the OAuth state parameter.
 
@@ -341,14 +359,12 @@ def serialize_auth_state(auth_state: AuthState, secret_key: str) -> str:
     Returns:
         URL-safe encrypted auth state string
     """
-    import json
-
-    fernet = Fernet(_derive_fernet_key(secret_key))
+    fernet = _get_fernet(secret_key)
     data = json.dumps({
         "code_verifier": auth_state.code_verifier,
         "redirect_url": auth_state.redirect_url,
         "nonce": auth_state.nonce,
-    }).encode()
+    }, separators=(",", ":")).encode()
     return fernet.encrypt(data).decode("ascii")
 
 
@@ -366,9 +382,7 @@ def deserialize_auth_state(encrypted_data: str, secret_key: str, max_age: int =
     Raises:
         ValidationException: If decryption fails, data expired, or payload is malformed
     """
-    import json
-
-    fernet = Fernet(_derive_fernet_key(secret_key))
+    fernet = _get_fernet(secret_key)
     try:
         plaintext = fernet.decrypt(encrypted_data.encode("ascii"), ttl=max_age)
         data = json.loads(plaintext)
@@ -398,6 +412,52 @@ def get_cookie_kwargs(config: Settings) -> dict[str, Any]:
     }
 
 
+def clear_auth_cookies(response: Response, config: Settings) -> None:
+    """Expire all auth cookies on the response.
+
+    The clearing ``Set-Cookie`` headers carry no per-request data, so they
+    are rendered once per cookie configuration and reused.
+    """
+    headers = _clear_auth_cookie_headers(
+        (config.oidc_cookie_name, config.oidc_refresh_cookie_name, "id_token"),
+        tuple(get_cookie_kwargs(config).items()),
+    )
+    for header in headers:
+        response.headers.add("Set-Cookie", header)
+
+
+@cache
+def _clear_auth_cookie_headers(
+    names: tuple[str, ...], cookie_kwargs: tuple[tuple[str, Any], ...]
+) -> tuple[str, ...]:
+    """Render the ``Set-Cookie`` header values that expire the given cookies.
+
+    ``cookie_kwargs`` is ``get_cookie_kwargs()`` as a hashable tuple of items,
+    so clearing uses exactly the same cookie flags as setting.
+    """
+    return tuple(
+        dump_cookie(name, "", max_age=0, expires=0, **dict(cookie_kwargs))
+        for name in names
+    )
+
+
+def register_public_endpoints(app: Any) -> None:
+    """Record the names of all @public endpoints on the app.
+
+    Called once at startup after all blueprints are registered so the
+    authentication hook can skip public endpoints with a single set lookup
+    via ``app.extensions["public_endpoints"]``.
+
+    Args:
+        app: The Flask application instance
+    """
+    app.extensions["public_endpoints"] = frozenset(
+        endpoint_name
+        for endpoint_name, view_func in app.view_functions.items()
+        if getattr(view_func, "is_public", False)
+    )
+
+
 def validate_allow_roles_at_startup(app: Any, auth_service: AuthService) -> None:
     """Validate that all @allow_roles decorators reference configured roles.
 
@@ -436,22 +496,35 @@ def validate_redirect_url(redirect_url: str, base_url: str) -> None:
     Raises:
         ValidationException: If redirect URL is invalid or external
     """
-    # Parse URLs
+    # Fast path for plain absolute paths. Scheme-relative ("//host"), backslash
+    # and control-character variants that browsers normalise into "//host" fall
+    # through to full parsing.
+    if (
+        redirect_url.startswith("/")
+        and not redirect_url.startswith("//")
+        and "\\" not in redirect_url
+        and redirect_url.isprintable()
+    ):
+        return
+
     redirect_parsed = urlparse(redirect_url)
-    base_parsed = urlparse(base_url)
 
     # Allow relative URLs (no scheme or netloc)
     if not redirect_parsed.scheme and not redirect_parsed.netloc:
         return
 
     # Allow URLs with same origin as base URL
-    if (
-        redirect_parsed.scheme == base_parsed.scheme
-        and redirect_parsed.netloc == base_parsed.netloc
-    ):
+    if (redirect_parsed.scheme, redirect_parsed.netloc) == _parse_origin(base_url):
         return
 
     # Reject external URLs
     raise ValidationException(
         "Invalid redirect URL - external redirects not allowed"
     )
+
+
+@lru_cache(maxsize=8)
+def _parse_origin(url: str) -> tuple[str, str]:
+    """Return the (scheme, netloc) of a URL; cached since BASEURL is constant."""
+    parsed = urlparse(url)
+    return parsed.scheme, parsed.netloc
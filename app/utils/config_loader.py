@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import stat
 from pathlib import Path
 from typing import Any
 
@@ -11,22 +12,33 @@ from pydantic import ValidationError
 from app.exceptions import ConfigLoadFailed
 from app.schemas.config import TabsConfig
 
+# Prefer the LibYAML-backed loader; fall back to the pure-Python one.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 def load_tabs_config(path: str) -> TabsConfig:
     """Read and validate the YAML configuration file."""
     candidate = Path(path)
-    if not candidate.exists():
-        raise ConfigLoadFailed("configuration file not found", path=path)
-    if not candidate.is_file():
+    try:
+        st = candidate.stat()
+    except (FileNotFoundError, NotADirectoryError) as exc:
+        raise ConfigLoadFailed("configuration file not found", path=path) from exc
+    except OSError as exc:
+        raise ConfigLoadFailed(f"failed to read configuration: {exc.strerror}", path=path) from exc
+    if not stat.S_ISREG(st.st_mode):
         raise ConfigLoadFailed("configuration path is not a file", path=path)
 
     try:
-        raw = candidate.read_text(encoding="utf-8")
+        # LibYAML decodes UTF-8 bytes itself
+        raw = candidate.read_bytes()
     except OSError as exc:
         raise ConfigLoadFailed(f"failed to read configuration: {exc.strerror}", path=path) from exc
 
     try:
-        payload = yaml.safe_load(raw) or {}
+        payload = yaml.load(raw, Loader=_YamlLoader) or {}
     except yaml.YAMLError as exc:
         message = getattr(exc, "problem_mark", None)
         detail = f"malformed YAML: {exc}"
@@ -7,9 +7,13 @@ allow layered composition:
 - register_core_error_handlers: Pydantic ValidationError, IntegrityError, HTTP 404/405/500
 - register_business_error_handlers: All BusinessLogicException subclasses
 - register_app_error_handlers: Convenience wrapper that calls both of the above
+
+resolve_error_handler_subclasses runs after all registrations to pre-resolve
+handlers for unregistered exception subclasses.
 """
 
 import logging
+from functools import partial
 from typing import Any
 
 from flask import Flask, g, jsonify
@@ -94,11 +98,10 @@ def register_core_error_handlers(app: Flask) -> None:
         """Handle Pydantic validation errors."""
         _mark_request_failed()
         logger.warning("Pydantic validation error: %s", str(error))
-        error_details = []
-        for err in error.errors():
-            field = ".".join(str(x) for x in err["loc"])
-            message = err["msg"]
-            error_details.append({"message": message, "field": field})
+        error_details = [
+            {"message": err["msg"], "field": ".".join(map(str, err["loc"]))}
+            for err in error.errors(include_url=False)
+        ]
 
         return build_error_response(
             "Validation failed",
@@ -138,101 +141,87 @@ def register_core_error_handlers(app: Flask) -> None:
         )
 
 
-def register_business_error_handlers(app: Flask) -> None:
-    """Register error handlers for business logic exceptions.
+# BusinessLogicException subclass -> (log label, details, HTTP status).
+# The base class entry is the catch-all for subclasses not listed here. The
+# details dicts are built once and shared by every response; jsonify only
+# reads them, so they must never be mutated.
+_BUSINESS_ERROR_RESPONSES: dict[
+    type[BusinessLogicException], tuple[str, dict[str, Any], int]
+] = {
+    AuthenticationException: (
+        "Authentication failure",
+        {"message": "Authentication is required to access this resource"},
+        401,
+    ),
+    AuthorizationException: (
+        "Authorization failure",
+        {"message": "You do not have permission to access this resource"},
+        403,
+    ),
+    ValidationException: (
+        "Validation exception",
+        {"message": "The request contains invalid data"},
+        400,
+    ),
+    RecordNotFoundException: (
+        "Record not found",
+        {"message": "The requested resource could not be found"},
+        404,
+    ),
+    ResourceConflictException: (
+        "Resource conflict",
+        {"message": "A resource with those details already exists"},
+        409,
+    ),
+    InvalidOperationException: (
+        "Invalid operation",
+        {"message": "The requested operation cannot be performed"},
+        409,
+    ),
+    RouteNotAvailableException: (
+        "Route not available",
+        {"message": "Testing endpoints require FLASK_ENV=testing"},
+        400,
+    ),
+    BusinessLogicException: (
+        "Business logic exception",
+        {"message": "A business logic operation failed"},
+        400,
+    ),
+}
+
+
+def _handle_business_exception(
+    log_label: str,
+    details: dict[str, Any],
+    status_code: int,
+    error: BusinessLogicException,
+) -> tuple[Response, int]:
+    """Convert a BusinessLogicException into its JSON error response.
 
-    Each BusinessLogicException subclass maps to a specific HTTP status code.
-    Handlers are registered from most-specific to least-specific so Flask's
-    MRO-based dispatch picks the right one.
+    Registered once per exception class with the class's table entry bound
+    via functools.partial, so dispatch needs no further lookup.
     """
+    _mark_request_failed()
+    logger.warning("%s: %s", log_label, error.message)
+    return build_error_response(
+        error.message,
+        details,
+        code=error.error_code,
+        status_code=status_code,
+    )
 
-    @app.errorhandler(AuthenticationException)
-    def handle_authentication_exception(error: AuthenticationException) -> tuple[Response, int]:
-        _mark_request_failed()
-        logger.warning("Authentication failure: %s", error.message)
-        return build_error_response(
-            error.message,
-            {"message": "Authentication is required to access this resource"},
-            code=error.error_code,
-            status_code=401,
-        )
-
-    @app.errorhandler(AuthorizationException)
-    def handle_authorization_exception(error: AuthorizationException) -> tuple[Response, int]:
-        _mark_request_failed()
-        logger.warning("Authorization failure: %s", error.message)
-        return build_error_response(
-            error.message,
-            {"message": "You do not have permission to access this resource"},
-            code=error.error_code,
-            status_code=403,
-        )
-
-    @app.errorhandler(ValidationException)
-    def handle_validation_exception(error: ValidationException) -> tuple[Response, int]:
-        _mark_request_failed()
-        logger.warning("Validation exception: %s", error.message)
-        return build_error_response(
-            error.message,
-            {"message": "The request contains invalid data"},
-            code=error.error_code,
-            status_code=400,
-        )
-
-    @app.errorhandler(RecordNotFoundException)
-    def handle_record_not_found(error: RecordNotFoundException) -> tuple[Response, int]:
-        _mark_request_failed()
-        logger.warning("Record not found: %s", error.message)
-        return build_error_response(
-            error.message,
-            {"message": "The requested resource could not be found"},
-            code=error.error_code,
-            status_code=404,
-        )
-
-    @app.errorhandler(ResourceConflictException)
-    def handle_resource_conflict(error: ResourceConflictException) -> tuple[Response, int]:
-        _mark_request_failed()
-        logger.warning("Resource conflict: %s", error.message)
-        return build_error_response(
-            error.message,
-            {"message": "A resource with those details already exists"},
-            code=error.error_code,
-            status_code=409,
-        )
 
-    @app.errorhandler(InvalidOperationException)
-    def handle_invalid_operation(error: InvalidOperationException) -> tuple[Response, int]:
-        _mark_request_failed()
-        logger.warning("Invalid operation: %s", error.message)
-        return build_error_response(
-            error.message,
-            {"message": "The requested operation cannot be performed"},
-            code=error.error_code,
-            status_code=409,
-        )
-
-    @app.errorhandler(RouteNotAvailableException)
-    def handle_route_not_available(error: RouteNotAvailableException) -> tuple[Response, int]:
-        _mark_request_failed()
-        logger.warning("Route not available: %s", error.message)
-        return build_error_response(
-            error.message,
-            {"message": "Testing endpoints require FLASK_ENV=testing"},
-            code=error.error_code,
-            status_code=400,
-        )
+def register_business_error_handlers(app: Flask) -> None:
+    """Register error handlers for business logic exceptions.
 
-    # Generic BusinessLogicException catch-all (least specific in hierarchy)
-    @app.errorhandler(BusinessLogicException)
-    def handle_business_logic_exception(error: BusinessLogicException) -> tuple[Response, int]:
-        _mark_request_failed()
-        logger.warning("Business logic exception: %s", error.message)
-        return build_error_response(
-            error.message,
-            {"message": "A business logic operation failed"},
-            code=error.error_code,
-            status_code=400,
+    Each BusinessLogicException subclass maps to a specific HTTP status code
+    via _BUSINESS_ERROR_RESPONSES; each gets the shared handler bound to its
+    own table entry.
+    """
+    for exception_class, response in _BUSINESS_ERROR_RESPONSES.items():
+        app.register_error_handler(
+            exception_class, partial(_handle_business_exception, *response)
         )
 
     # Generic Exception catch-all for unexpected errors
@@ -254,3 +243,24 @@ def register_app_error_handlers(app: Flask) -> None:
     """
     register_core_error_handlers(app)
     register_business_error_handlers(app)
+
+
+def resolve_error_handler_subclasses(app: Flask) -> None:
+    """Register resolved handlers for unregistered exception subclasses.
+
+    Flask looks up class-based handlers by walking the raised exception's MRO.
+    Mapping each subclass of a handled exception directly to the handler its
+    MRO walk would find turns that into a single lookup. The ``Exception``
+    catch-all is excluded; it would touch every exception class in the process.
+    Must be called after all error handlers are registered.
+    """
+    handler_map = app.error_handler_spec[None][None]
+    pending = [cls for cls in handler_map if cls is not Exception]
+
+    while pending:
+        for subclass in pending.pop().__subclasses__():
+            if subclass not in handler_map:
+                # Same resolution Flask would perform at dispatch time
+                handler = next(handler_map[c] for c in subclass.__mro__ if c in handler_map)
+                handler_map[subclass] = handler
+            pending.append(subclass)
@@ -88,8 +88,12 @@ class LifecycleCoordinator(LifecycleCoordinatorProtocol):
         self._graceful_shutdown_timeout = graceful_shutdown_timeout
         self._shutting_down = False
         self._started = False
+        # Re-entrant on purpose: the SIGTERM handler runs on the main thread and
+        # may interrupt code that already holds the lock.
         self._lifecycle_lock = threading.RLock()
-        self._lifecycle_notifications: list[Callable[[LifecycleEvent], None]] = []
+        # Callbacks are stored with their display name, resolved once at
+        # registration so dispatch doesn't repeat it.
+        self._lifecycle_notifications: list[tuple[str, Callable[[LifecycleEvent], None]]] = []
         self._shutdown_waiters: dict[str, Callable[[float], bool]] = {}
 
         logger.info("LifecycleCoordinator initialized")
@@ -102,19 +106,25 @@ class LifecycleCoordinator(LifecycleCoordinatorProtocol):
     def register_lifecycle_notification(self, callback: Callable[[LifecycleEvent], None]) -> None:
         """Register a callback to be notified on lifecycle events."""
         with self._lifecycle_lock:
-            self._lifecycle_notifications.append(callback)
-            logger.debug(f"Registered lifecycle notification: {getattr(callback, '__name__', repr(callback))}")
+            name = getattr(callback, "__name__", repr(callback))
+            self._lifecycle_notifications.append((name, callback))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Registered lifecycle notification: {name}")
 
     def register_shutdown_waiter(self, name: str, handler: Callable[[float], bool]) -> None:
         """Register a handler that blocks until ready for shutdown."""
         with self._lifecycle_lock:
             self._shutdown_waiters[name] = handler
-            logger.debug(f"Registered shutdown waiter: {name}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Registered shutdown waiter: {name}")
 
     def is_shutting_down(self) -> bool:
-        """Check if shutdown has been initiated."""
-        with self._lifecycle_lock:
-            return self._shutting_down
+        """Check if shutdown has been initiated.
+
+        Lock-free: the flag only ever flips from False to True, and reading
+        a bool attribute is atomic.
+        """
+        return self._shutting_down
 
     def fire_startup(self) -> None:
         """Fire the STARTUP lifecycle event. Idempotent: second call is a no-op."""
@@ -195,8 +205,8 @@ class LifecycleCoordinator(LifecycleCoordinatorProtocol):
     def _raise_lifecycle_event(self, event: LifecycleEvent) -> None:
         logger.info(f"Raising lifecycle event {event}")
 
-        for callback in self._lifecycle_notifications:
+        for name, callback in self._lifecycle_notifications:
             try:
                 callback(event)
             except Exception as e:
-                logger.error(f"Error in lifecycle event notification {getattr(callback, '__name__', repr(callback))}: {e}")
+                logger.error(f"Error in lifecycle event notification {name}: {e}")
@@ -5,34 +5,91 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from datetime import UTC, datetime
+from collections import deque
 from typing import Any
 
 from app.utils import get_current_correlation_id
 from app.utils.lifecycle_coordinator import LifecycleCoordinatorProtocol, LifecycleEvent
+from app.utils.sse_utils import format_sse_event
+
+# Standard LogRecord attributes that are not user-supplied ``extra`` fields
+_SKIP_ATTRS = frozenset({
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 'filename',
+    'module', 'exc_info', 'exc_text', 'stack_info', 'lineno', 'funcName',
+    'created', 'msecs', 'relativeCreated', 'thread', 'threadName',
+    'processName', 'process', 'getMessage', 'message'
+})
+
+
+# (whole second, formatted prefix) of the most recent timestamp; log records
+# arrive in bursts within the same second, so the strftime work is shared.
+_last_second: tuple[int, str] = (-1, "")
+
+
+def _format_timestamp(created: float) -> str:
+    """Format a record creation time like ``datetime.isoformat()`` in UTC."""
+    global _last_second
+
+    second = int(created)
+    micros = round((created - second) * 1_000_000)
+    if micros == 1_000_000:
+        second += 1
+        micros = 0
+
+    # Read the cache once; another thread may replace it concurrently.
+    cached_second, prefix = _last_second
+    if cached_second != second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _last_second = (second, prefix)
+
+    if micros:
+        return f"{prefix}.{micros:06d}+00:00"
+    return f"{prefix}+00:00"
+
+
+class LogEvent:
+    """A broadcast log event, shared by every connected client.
+
+    The SSE frame is encoded on first use and reused by all clients that
+    need the same correlation ID, instead of each client encoding the
+    event itself.
+    """
+
+    __slots__ = ("event_type", "data", "_frames")
+
+    def __init__(self, event_type: str, data: dict[str, Any]) -> None:
+        self.event_type = event_type
+        self.data = data
+        self._frames: dict[str | None, bytes] = {}
+
+    def to_sse(self, correlation_id: str | None = None) -> bytes:
+        """Get the SSE frame, adding correlation_id if the event has none."""
+        if "correlation_id" in self.data:
+            correlation_id = None
+        frame = self._frames.get(correlation_id)
+        if frame is None:
+            frame = format_sse_event(self.event_type, self.data, correlation_id)
+            self._frames[correlation_id] = frame
+        return frame
 
 
 class LogCaptureHandler(logging.Handler):
     """Custom logging handler that captures log records and streams them to SSE clients."""
 
-    _instance: LogCaptureHandler | None = None
-    _lock = threading.Lock()
-
     def __init__(self) -> None:
         super().__init__()
         self.level = logging.INFO
         self._clients: set[Any] = set()  # SSE client generators
-        self._client_lock = threading.RLock()
+        # Immutable copy of _clients, swapped on every change so that
+        # broadcasting can iterate it without taking the lock
+        self._clients_snapshot: tuple[Any, ...] = ()
+        self._client_lock = threading.Lock()
         self.lifecycle_coordinator: LifecycleCoordinatorProtocol | None = None
 
     @classmethod
     def get_instance(cls) -> LogCaptureHandler:
         """Get singleton instance of log capture handler."""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = cls()
-        return cls._instance
+        return _INSTANCE
 
     def set_lifecycle_coordinator(self, coordinator: LifecycleCoordinatorProtocol) -> None:
         """Set lifecycle coordinator for sending connection_close events."""
@@ -48,11 +105,13 @@ class LogCaptureHandler(logging.Handler):
         """Register an SSE client for log streaming."""
         with self._client_lock:
             self._clients.add(client)
+            self._clients_snapshot = tuple(self._clients)
 
     def unregister_client(self, client: Any) -> None:
         """Unregister an SSE client from log streaming."""
         with self._client_lock:
             self._clients.discard(client)
+            self._clients_snapshot = tuple(self._clients)
 
     def emit(self, record: logging.LogRecord) -> None:
         """Emit a log record to all connected SSE clients."""
@@ -69,21 +128,15 @@ class LogCaptureHandler(logging.Handler):
         correlation_id = get_current_correlation_id()
 
         # Create timestamp in ISO format
-        timestamp = datetime.fromtimestamp(record.created, tz=UTC).isoformat()
+        timestamp = _format_timestamp(record.created)
 
         # Extract extra fields from log record
-        extra = {}
-        skip_attrs = {
-            'name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 'filename',
-            'module', 'exc_info', 'exc_text', 'stack_info', 'lineno', 'funcName',
-            'created', 'msecs', 'relativeCreated', 'thread', 'threadName',
-            'processName', 'process', 'getMessage', 'message'
+        extra = {
+            key: value
+            for key, value in record.__dict__.items()
+            if key not in _SKIP_ATTRS and not key.startswith('_')
         }
 
-        for key, value in record.__dict__.items():
-            if key not in skip_attrs and not key.startswith('_'):
-                extra[key] = value
-
         log_data: dict[str, Any] = {
             "timestamp": timestamp,
             "level": record.levelname,
@@ -101,24 +154,29 @@ class LogCaptureHandler(logging.Handler):
 
     def _broadcast_event(self, event_type: str, data: dict[str, Any]) -> None:
         """Broadcast an event to all connected SSE clients."""
-        with self._client_lock:
-            # Create a copy of clients to avoid modification during iteration
-            clients_to_remove = []
-            for client in list(self._clients):
-                try:
-                    # Send event to client (this depends on SSE implementation)
-                    if hasattr(client, 'send_event'):
-                        client.send_event(event_type, data)
-                    elif hasattr(client, 'put'):
-                        # Queue-based client
-                        client.put((event_type, data))
-                except Exception:
-                    # Client disconnected or error, mark for removal
-                    clients_to_remove.append(client)
-
-            # Remove failed clients
-            for client in clients_to_remove:
-                self._clients.discard(client)
+        clients_to_remove = []
+        event = LogEvent(event_type, data)
+        for client in self._clients_snapshot:
+            try:
+                # Send event to client (this depends on SSE implementation)
+                if hasattr(client, 'send_event'):
+                    client.send_event(event_type, data)
+                elif hasattr(client, 'put'):
+                    # Queue-based client
+                    client.put(event)
+            except Exception:
+                # Client disconnected or error, mark for removal
+                clients_to_remove.append(client)
+
+        # Remove failed clients
+        if clients_to_remove:
+            with self._client_lock:
+                self._clients.difference_update(clients_to_remove)
+                self._clients_snapshot = tuple(self._clients)
+
+
+# Created eagerly at import; construction only allocates empty state.
+_INSTANCE = LogCaptureHandler()
 
 
 class SSELogClient:
@@ -126,8 +184,9 @@ class SSELogClient:
 
     def __init__(self) -> None:
         self.handler = LogCaptureHandler.get_instance()
-        self._events: list[tuple[str, dict[str, Any]]] = []
-        self._lock = threading.Lock()
+        # deque append/popleft are thread-safe; the event wakes waiting readers
+        self._events: deque[LogEvent] = deque()
+        self._event_ready = threading.Event()
         self._closed = False
 
     def __enter__(self) -> SSELogClient:
@@ -143,25 +202,31 @@ class SSELogClient:
             self._closed = True
             self.handler.unregister_client(self)
 
-    def put(self, event: tuple[str, dict[str, Any]]) -> None:
+    def put(self, event: LogEvent) -> None:
         """Receive an event from the log handler."""
         if not self._closed:
-            with self._lock:
-                self._events.append(event)
+            self._events.append(event)
+            self._event_ready.set()
 
-    def get_events(self) -> list[tuple[str, dict[str, Any]]]:
+    def get_events(self) -> list[LogEvent]:
         """Get all buffered events."""
-        with self._lock:
-            events = self._events.copy()
-            self._events.clear()
-            return events
+        # Clear before draining so an event put mid-drain re-arms the flag
+        self._event_ready.clear()
+        events = []
+        while True:
+            try:
+                events.append(self._events.popleft())
+            except IndexError:
+                return events
 
-    def wait_for_events(self, timeout: float = 1.0) -> list[tuple[str, dict[str, Any]]]:
+    def wait_for_events(self, timeout: float = 1.0) -> list[LogEvent]:
         """Wait for events with timeout."""
-        start_time = time.perf_counter()
-        while time.perf_counter() - start_time < timeout:
+        deadline = time.perf_counter() + timeout
+        while True:
             events = self.get_events()
             if events:
                 return events
-            time.sleep(0.01)
-        return self.get_events()
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return events
+            self._event_ready.wait(remaining)
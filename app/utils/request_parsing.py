@@ -5,14 +5,12 @@ from __future__ import annotations
 from collections.abc import Sequence
 from enum import Enum
 
-_TRUE_VALUES = {"true", "1", "yes", "on"}
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
 
 
 def parse_bool_query_param(raw_value: str | None, *, default: bool = False) -> bool:
     """Interpret a truthy query parameter value with a configurable default."""
-    if raw_value is None:
-        return default
-    return raw_value.lower() in _TRUE_VALUES
+    return default if raw_value is None else raw_value.lower() in _TRUE_VALUES
 
 
 def parse_enum_list_query_param[EnumType: Enum](
@@ -34,29 +32,27 @@ def parse_enum_list_query_param[EnumType: Enum](
     if not raw_values:
         return []
 
-    tokens: list[str] = []
-    for raw_value in raw_values:
-        if not raw_value:
-            continue
-        tokens.extend(segment.strip() for segment in raw_value.split(",") if segment.strip())
-
-    if not tokens:
-        return []
-
-    parsed: list[EnumType] = []
-    seen: set[EnumType] = set()
+    # Direct value lookup; enum_cls(token) is only needed on a miss so that
+    # enums with a custom _missing_ hook still resolve.
+    value_map: dict[object, EnumType] = enum_cls._value2member_map_  # type: ignore[assignment]
+    parsed: dict[EnumType, None] = {}
     invalid_values: list[str] = []
 
-    for token in tokens:
-        try:
-            enum_member = enum_cls(token)
-        except ValueError:
-            invalid_values.append(token)
+    for raw_value in raw_values:
+        if not raw_value:
             continue
-
-        if enum_member not in seen:
-            parsed.append(enum_member)
-            seen.add(enum_member)
+        for segment in raw_value.split(","):
+            token = segment.strip()
+            if not token:
+                continue
+            enum_member = value_map.get(token)
+            if enum_member is None:
+                try:
+                    enum_member = enum_cls(token)
+                except ValueError:
+                    invalid_values.append(token)
+                    continue
+            parsed[enum_member] = None
 
     if invalid_values:
         valid_values = ", ".join(
@@ -66,7 +62,7 @@ def parse_enum_list_query_param[EnumType: Enum](
             f"invalid value(s): {', '.join(invalid_values)}; valid values are: {valid_values}"
         )
 
-    return parsed
+    return list(parsed)
 
 
 __all__ = ["parse_bool_query_param", "parse_enum_list_query_param"]
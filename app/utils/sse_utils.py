@@ -8,8 +8,23 @@ from flask import Response
 
 SSE_HEARTBEAT_INTERVAL = 5  # Will be overridden by config
 
+# Upper bound on the size of one chunk when a stream coalesces queued events
+SSE_MAX_CHUNK_BYTES = 16 * 1024
 
-def format_sse_event(event: str, data: dict[str, Any] | str, correlation_id: str | None = None) -> str:
+# Shared compact encoder; json.dumps() with custom options would build a new
+# JSONEncoder on every call.
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
+# Werkzeug copies these into each response's own Headers object, so the
+# dict is shared and must not be mutated
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "Cache-Control",
+}
+
+
+def format_sse_event(event: str, data: dict[str, Any] | str, correlation_id: str | None = None) -> bytes:
     """Format event name and data into SSE format.
 
     Args:
@@ -18,22 +33,22 @@ def format_sse_event(event: str, data: dict[str, Any] | str, correlation_id: str
         correlation_id: Optional correlation ID to include in event data
 
     Returns:
-        Formatted SSE event string
+        Formatted SSE event, UTF-8 encoded so the response can stream it as-is
     """
     if isinstance(data, dict):
         # Add correlation ID to event data if provided
         if correlation_id and "correlation_id" not in data:
-            data = data.copy()  # Don't modify the original dict
-            data["correlation_id"] = correlation_id
-        data = json.dumps(data)
-    return f"event: {event}\ndata: {data}\n\n"
+            # Build a new dict; the original must not be modified
+            data = {**data, "correlation_id": correlation_id}
+        data = _encode_json(data)
+    return f"event: {event}\ndata: {data}\n\n".encode()
 
 
-def create_sse_response(generator: Generator[str]) -> Response:
+def create_sse_response(generator: Generator[bytes]) -> Response:
     """Create Response with standard SSE headers.
 
     Args:
-        generator: Generator function that yields SSE-formatted strings
+        generator: Generator function that yields SSE-formatted bytes
 
     Returns:
         Flask Response configured for SSE streaming
@@ -41,9 +56,5 @@ def create_sse_response(generator: Generator[str]) -> Response:
     return Response(
         generator,
         mimetype="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Headers": "Cache-Control"
-        }
+        headers=_SSE_HEADERS,
     )
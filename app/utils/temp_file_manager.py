@@ -3,8 +3,14 @@
 import hashlib
 import json
 import logging
+import os
+import shutil
+import struct
 import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import NamedTuple
 from uuid import uuid4
@@ -13,6 +19,26 @@ from app.utils.lifecycle_coordinator import LifecycleCoordinatorProtocol, Lifecy
 
 logger = logging.getLogger(__name__)
 
+# Shared compact encoder for cache metadata
+_encode_metadata = json.JSONEncoder(separators=(",", ":")).encode
+
+# Cache files hold this header (the metadata length), the JSON metadata and
+# then the raw content
+_CACHE_HEADER = struct.Struct("<I")
+
+# Suffixes of the old two-file cache format (content .bin plus metadata .json);
+# these files are no longer read and are removed by cleanup_old_files
+_LEGACY_CACHE_SUFFIXES = (".bin", ".json")
+
+# Total content size of recently used cache entries also kept in memory
+_MEMORY_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+
+@lru_cache(maxsize=1024)
+def _hash_url(url: str) -> str:
+    """Hash a URL into a cache key; memoized because hits repeat URLs."""
+    return hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+
 
 class CachedContent(NamedTuple):
     """Cached download content with metadata."""
@@ -47,29 +73,41 @@ class TempFileManager:
         self.cleanup_age_hours = cleanup_age_hours
         self.lifecycle_coordinator = lifecycle_coordinator
         self._cleanup_thread: threading.Thread | None = None
+        # Guards _cleanup_thread; start and stop may race from different threads
+        self._state_lock = threading.Lock()
         self._shutdown_event = threading.Event()
 
         # Ensure base directory exists (also used for download cache)
         self.base_path.mkdir(parents=True, exist_ok=True)
         self.cache_path = self.base_path
 
+        # In-memory LRU in front of the disk cache, keyed by URL hash
+        self._memory_cache: OrderedDict[str, CachedContent] = OrderedDict()
+        self._memory_cache_bytes = 0
+        self._memory_cache_lock = threading.Lock()
+
         # Register lifecycle notification
         self.lifecycle_coordinator.register_lifecycle_notification(self._on_lifecycle_event)
 
     def start_cleanup_thread(self) -> None:
         """Start the background cleanup thread."""
-        if self._cleanup_thread is None or not self._cleanup_thread.is_alive():
+        with self._state_lock:
+            if self._cleanup_thread is not None and self._cleanup_thread.is_alive():
+                return
             self._cleanup_thread = threading.Thread(
                 target=self._cleanup_loop, daemon=True
             )
             self._cleanup_thread.start()
-            logger.info("Started temporary file cleanup thread")
+        logger.info("Started temporary file cleanup thread")
 
     def _stop_cleanup_thread(self) -> None:
         """Stop the background cleanup thread."""
         self._shutdown_event.set()
-        if self._cleanup_thread and self._cleanup_thread.is_alive():
-            self._cleanup_thread.join(timeout=5.0)
+        with self._state_lock:
+            cleanup_thread = self._cleanup_thread
+        # Join outside the lock so a concurrent start call isn't blocked
+        if cleanup_thread and cleanup_thread.is_alive():
+            cleanup_thread.join(timeout=5.0)
             logger.info("Stopped temporary file cleanup thread")
 
     def create_temp_directory(self) -> Path:
@@ -96,39 +134,50 @@ class TempFileManager:
         """
         Clean up temporary directories older than cleanup_age_hours.
 
+        Cache files left behind in the old two-file format are removed too,
+        regardless of age, since they can no longer be read.
+
         Returns:
             Number of directories cleaned up
         """
         if not self.base_path.exists():
             return 0
 
-        cutoff_time = datetime.now() - timedelta(hours=self.cleanup_age_hours)
+        cutoff_time = time.time() - self.cleanup_age_hours * 3600
         cleaned_count = 0
+        legacy_count = 0
 
         try:
-            for item in self.base_path.iterdir():
-                if not item.is_dir():
-                    continue
-
-                # Get directory creation time
-                stat_info = item.stat()
-                created_time = datetime.fromtimestamp(stat_info.st_ctime)
-
-                if created_time < cutoff_time:
-                    try:
-                        # Remove directory and all contents
-                        import shutil
-                        shutil.rmtree(item)
-                        cleaned_count += 1
-                        logger.debug(f"Cleaned up old temporary directory: {item}")
-                    except Exception as e:
-                        logger.warning(f"Failed to clean up directory {item}: {e}")
+            # scandir yields the directory type from the listing itself, so
+            # only directories cost a stat() call
+            with os.scandir(self.base_path) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        if entry.name.endswith(_LEGACY_CACHE_SUFFIXES):
+                            try:
+                                os.unlink(entry.path)
+                                legacy_count += 1
+                            except OSError as e:
+                                logger.warning(f"Failed to remove legacy cache file {entry.path}: {e}")
+                        continue
+
+                    # Get directory creation time
+                    if entry.stat(follow_symlinks=False).st_ctime < cutoff_time:
+                        try:
+                            # Remove directory and all contents
+                            shutil.rmtree(entry.path)
+                            cleaned_count += 1
+                            logger.debug(f"Cleaned up old temporary directory: {entry.path}")
+                        except Exception as e:
+                            logger.warning(f"Failed to clean up directory {entry.path}: {e}")
 
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
 
         if cleaned_count > 0:
             logger.info(f"Cleaned up {cleaned_count} old temporary directories")
+        if legacy_count > 0:
+            logger.info(f"Removed {legacy_count} legacy cache files")
 
         return cleaned_count
 
@@ -144,15 +193,15 @@ class TempFileManager:
 
     def _url_to_path(self, url: str) -> str:
         """
-        Convert URL to cache file path using SHA256 hash.
+        Convert URL to cache file path using a 128-bit BLAKE2b hash.
 
         Args:
             url: URL to convert
 
         Returns:
-            SHA256 hash of the URL for use as filename
+            BLAKE2b hash of the URL for use as filename
         """
-        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return _hash_url(url)
 
     def get_cached(self, url: str) -> CachedContent | None:
         """
@@ -165,39 +214,57 @@ class TempFileManager:
             CachedContent if cached and valid, None otherwise
         """
         cache_key = self._url_to_path(url)
-        content_file = self.cache_path / f"{cache_key}.bin"
-        metadata_file = self.cache_path / f"{cache_key}.json"
+        max_age = timedelta(hours=self.cleanup_age_hours)
+
+        with self._memory_cache_lock:
+            cached = self._memory_cache.get(cache_key)
+            if cached is not None:
+                if datetime.now() - cached.timestamp > max_age:
+                    del self._memory_cache[cache_key]
+                    self._memory_cache_bytes -= len(cached.content)
+                    return None
+                self._memory_cache.move_to_end(cache_key)
+                return cached
 
-        # Check if both files exist
-        if not content_file.exists() or not metadata_file.exists():
+        cache_file = self.cache_path / f"{cache_key}.cache"
+
+        try:
+            # Header, metadata and content are read with a single open
+            data = cache_file.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Failed to load cached content for {url}: {e}")
             return None
 
         try:
-            # Load metadata
-            with open(metadata_file, encoding='utf-8') as f:
-                metadata = json.load(f)
+            (metadata_length,) = _CACHE_HEADER.unpack_from(data)
+            metadata_end = _CACHE_HEADER.size + metadata_length
+            metadata = json.loads(data[_CACHE_HEADER.size:metadata_end])
 
             cached_time = datetime.fromisoformat(metadata['timestamp'])
 
             # Check if cache is still valid
-            if (datetime.now() - cached_time >
-                timedelta(hours=self.cleanup_age_hours)):
+            if datetime.now() - cached_time > max_age:
                 return None
 
-            # Load content
-            with open(content_file, 'rb') as f:
-                content = f.read()
+            content = data[metadata_end:]
+            if len(content) != metadata['size']:
+                raise ValueError("cache file is truncated")
 
-            return CachedContent(
+            cached = CachedContent(
                 content=content,
                 content_type=metadata['content_type'],
                 timestamp=cached_time
             )
 
-        except (OSError, json.JSONDecodeError, KeyError, ValueError) as e:
+        except (struct.error, json.JSONDecodeError, KeyError, ValueError) as e:
             logger.warning(f"Failed to load cached content for {url}: {e}")
             return None
 
+        self._remember(cache_key, cached)
+        return cached
+
     def cache(self, url: str, content: bytes, content_type: str) -> bool:
         """
         Store content in cache for the given URL.
@@ -212,23 +279,23 @@ class TempFileManager:
         """
         try:
             cache_key = self._url_to_path(url)
-            content_file = self.cache_path / f"{cache_key}.bin"
-            metadata_file = self.cache_path / f"{cache_key}.json"
-
-            # Store content
-            with open(content_file, 'wb') as f:
-                f.write(content)
+            cache_file = self.cache_path / f"{cache_key}.cache"
+            timestamp = datetime.now()
 
-            # Store metadata
             metadata = {
                 'url': url,
                 'content_type': content_type,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp.isoformat(),
                 'size': len(content)
             }
+            metadata_bytes = _encode_metadata(metadata).encode('utf-8')
 
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2)
+            # Store header, metadata and content with a single write
+            cache_file.write_bytes(
+                b"".join((_CACHE_HEADER.pack(len(metadata_bytes)), metadata_bytes, content))
+            )
+
+            self._remember(cache_key, CachedContent(content, content_type, timestamp))
 
             logger.debug(f"Cached content for URL {url} ({len(content)} bytes)")
             return True
@@ -237,6 +304,25 @@ class TempFileManager:
             logger.error(f"Failed to cache content for {url}: {e}")
             return False
 
+    def _remember(self, cache_key: str, cached: CachedContent) -> None:
+        """Add an entry to the in-memory cache, evicting the least recently used.
+
+        Entries larger than the whole memory budget are served from disk only.
+        """
+        size = len(cached.content)
+        with self._memory_cache_lock:
+            previous = self._memory_cache.pop(cache_key, None)
+            if previous is not None:
+                self._memory_cache_bytes -= len(previous.content)
+            if size > _MEMORY_CACHE_MAX_BYTES:
+                return
+
+            self._memory_cache[cache_key] = cached
+            self._memory_cache_bytes += size
+            while self._memory_cache_bytes > _MEMORY_CACHE_MAX_BYTES:
+                _, evicted = self._memory_cache.popitem(last=False)
+                self._memory_cache_bytes -= len(evicted.content)
+
     def _on_lifecycle_event(self, event: LifecycleEvent) -> None:
         """Callback when a lifecycle event occurs."""
         match event:
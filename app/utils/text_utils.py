@@ -1,6 +1,7 @@
 """Utilities for working with text."""
 
+_ELLIPSIS = "\u2026"
+
+
 def truncate_with_ellipsis(text: str, length: int, encoding : str | None = None) -> str:
-    if len(text) > length:
-        return text[:(length - 1)] + "\u2026"
-    return text
+    return text if len(text) <= length else text[:length - 1] + _ELLIPSIS
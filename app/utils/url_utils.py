@@ -1,10 +1,18 @@
 import os
-from urllib.parse import urlparse
+from urllib.parse import scheme_chars
+
+# urlsplit strips leading C0 controls and spaces and removes tabs and newlines
+# anywhere in the URL before parsing
+_LEADING_STRIP_CHARS = "".join(map(chr, range(0x21)))
+_UNSAFE_CHARS = str.maketrans("", "", "\t\r\n")
 
 
 def get_filename_from_url(url: str, default_title: str) -> str:
     """Extract filename from URL path or return default title if extraction fails.
 
+    The path is located with plain string searches rather than urlparse,
+    which builds every URL component just to discard all but the path.
+
     Args:
         url: The URL to extract the filename from
         default_title: Fallback title if extraction fails
@@ -12,12 +20,31 @@ def get_filename_from_url(url: str, default_title: str) -> str:
     Returns:
         Extracted filename or default title
     """
-    try:
-        parsed_url = urlparse(url)
-        filename = os.path.basename(parsed_url.path)
-        if filename and filename != '/':
-            return filename
-    except Exception:
-        pass  # Ignore URL parsing errors, will use fallback
+    url = url.lstrip(_LEADING_STRIP_CHARS).translate(_UNSAFE_CHARS)
+
+    # Drop the scheme, using urlsplit's rule for what counts as one
+    scheme, sep, rest = url.partition(":")
+    if sep and scheme[:1].isalpha() and all(c in scheme_chars for c in scheme):
+        url = rest
+
+    path = url
+    if url.startswith("//"):
+        # Skip the authority; it ends at the first "/", "?" or "#"
+        path_start = len(url)
+        for delim in "/?#":
+            index = url.find(delim, 2)
+            if 0 <= index < path_start:
+                path_start = index
+        path = url[path_start:]
+
+    # The path ends where the query or fragment begins
+    for delim in "?#":
+        index = path.find(delim)
+        if index >= 0:
+            path = path[:index]
+
+    filename = os.path.basename(path).partition(";")[0]
+    if filename:
+        return filename
 
     return default_title
@@ -2,7 +2,9 @@
 
 import logging
 import os
+import queue
 import threading
+from logging.handlers import QueueHandler, QueueListener
 
 from paste.translogger import TransLogger  # type: ignore[import-untyped]
 from waitress import serve
@@ -57,6 +59,18 @@ def main() -> None:
     else:
         lifecycle_coordinator.initialize()
 
+        # TransLogger writes one access log line per request. Hand those
+        # records to a listener thread so the stream I/O happens off the
+        # request threads. The listener forwards to the root logger rather than
+        # a snapshot of its handlers, so handlers added or replaced later
+        # still receive access logs.
+        access_log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        access_log_listener = QueueListener(access_log_queue, logging.getLogger())
+        access_logger = logging.getLogger("wsgi")
+        access_logger.addHandler(QueueHandler(access_log_queue))
+        access_logger.propagate = False
+        access_log_listener.start()
+
         def runner() -> None:
             # Production: Use Waitress WSGI server
             wsgi = TransLogger(app, setup_console_handler=False)
@@ -89,5 +103,8 @@ def main() -> None:
 
         event.wait()
 
+        # Last step before exit: flush the access log lines still queued
+        access_log_listener.stop()
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,28 @@
+"""Tests for the /api/testing/logs/stream endpoint."""
+
+from __future__ import annotations
+
+import logging
+
+
+def test_log_stream_sends_open_event_and_logs(client):
+    response = client.get("/api/testing/logs/stream", buffered=False)
+    try:
+        assert response.status_code == 200
+        assert response.mimetype == "text/event-stream"
+
+        chunks = iter(response.response)
+        assert next(chunks).startswith(b"event: connection_open\n")
+
+        logging.getLogger("tests.log_stream").warning("hello from the log stream test")
+
+        # Other log records may be streamed first; the test record must follow
+        for _ in range(20):
+            chunk = next(chunks)
+            if b"hello from the log stream test" in chunk:
+                break
+        else:
+            raise AssertionError("log record was not streamed")
+        assert b"event: log\n" in chunk
+    finally:
+        response.close()
@@ -6,38 +6,40 @@ domain fixtures.
 """
 
 import textwrap
+from collections.abc import Generator
 from pathlib import Path
 
 import pytest
 
 from app.app_config import AppSettings
+from app.schemas.config import TabsConfig
 from app.services.config_service import ConfigService
 from app.utils.config_loader import load_tabs_config
 
 # Import all infrastructure fixtures
 from tests.conftest_infrastructure import *  # noqa: F403
 
+_TABS_YAML = textwrap.dedent("""\
+    tabs:
+      - text: Primary Dashboard
+        iconUrl: https://example.com/icon-a.svg
+        iframeUrl: https://example.com/dashboard
+        tabColor: "#123456"
+      - text: Code Server
+        iconUrl: https://example.com/icon-b.svg
+        iframeUrl: https://example.com/code
+        tabColor: "#654321"
+        k8s:
+          namespace: default
+          deployment: code-server
+""").encode("utf-8")
 
-@pytest.fixture
-def tabs_config_path(tmp_path: Path) -> Path:
-    """Write a temporary tabs config YAML and return its path."""
-    path = tmp_path / "tabs.yml"
-    path.write_text(
-        textwrap.dedent("""\
-            tabs:
-              - text: Primary Dashboard
-                iconUrl: https://example.com/icon-a.svg
-                iframeUrl: https://example.com/dashboard
-                tabColor: "#123456"
-              - text: Code Server
-                iconUrl: https://example.com/icon-b.svg
-                iframeUrl: https://example.com/code
-                tabColor: "#654321"
-                k8s:
-                  namespace: default
-                  deployment: code-server
-        """)
-    )
+
+@pytest.fixture(scope="session")
+def tabs_config_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write a temporary tabs config YAML once per session and return its path."""
+    path = tmp_path_factory.mktemp("config") / "tabs.yml"
+    path.write_bytes(_TABS_YAML)
     return path
 
 
@@ -50,21 +52,35 @@ def test_app_settings(tabs_config_path: Path) -> AppSettings:
     )
 
 
-@pytest.fixture(autouse=True)
-def _mock_kube_config(monkeypatch):
-    """Prevent Kubernetes config loading during tests."""
-    monkeypatch.setattr(
-        "app.services.kubernetes_service.config.load_kube_config",
-        lambda: None,
-    )
-    monkeypatch.setattr(
-        "app.services.kubernetes_service.config.load_incluster_config",
-        lambda: None,
-    )
+@pytest.fixture(autouse=True, scope="session")
+def _mock_kube_config() -> Generator[None]:
+    """Prevent Kubernetes config loading during tests.
 
+    The patch never varies between tests, so it is applied once per session.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(
+            "app.services.kubernetes_service.config.load_kube_config",
+            lambda: None,
+        )
+        monkeypatch.setattr(
+            "app.services.kubernetes_service.config.load_incluster_config",
+            lambda: None,
+        )
+        yield
 
-@pytest.fixture
-def config_service(tabs_config_path: Path) -> ConfigService:
-    """Create a ConfigService from the test tabs config."""
-    tabs_config = load_tabs_config(str(tabs_config_path))
+
+@pytest.fixture(scope="session")
+def tabs_config(tabs_config_path: Path) -> TabsConfig:
+    """Parse the test tabs config once per session."""
+    return load_tabs_config(str(tabs_config_path))
+
+
+@pytest.fixture(scope="session")
+def config_service(tabs_config: TabsConfig) -> ConfigService:
+    """Create a ConfigService from the test tabs config.
+
+    ConfigService is read-only and hands out deep copies of its tabs, so one
+    instance is shared by the whole session.
+    """
     return ConfigService(tabs_config.tabs)
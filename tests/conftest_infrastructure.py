@@ -6,10 +6,12 @@ client, session, OIDC) that the template owns. App-specific fixtures
 """
 
 from collections.abc import Generator
+from contextlib import ExitStack
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 from dotenv import load_dotenv
 from flask import Flask
@@ -18,6 +20,7 @@ from prometheus_client import REGISTRY
 from app import create_app
 from app.app_config import AppSettings
 from app.config import Settings
+from app.services import auth_service
 
 # Load test environment variables from .env.test
 _TEST_ENV_FILE = Path(__file__).parent.parent / ".env.test"
@@ -25,30 +28,31 @@ if _TEST_ENV_FILE.exists():
     load_dotenv(_TEST_ENV_FILE, override=True)
 
 
+@pytest.fixture(scope="session")
+def prometheus_baseline() -> frozenset[Any]:
+    """Snapshot the collectors registered once the application is imported.
+
+    Module-level metrics register themselves at import, so importing the
+    service container first puts all of them in the baseline.
+    """
+    import app.services.container  # noqa: F401
+
+    return frozenset(REGISTRY._collector_to_names)
+
+
 @pytest.fixture(autouse=True)
-def clear_prometheus_registry():
-    """Clear Prometheus registry before and after each test to ensure isolation.
+def clear_prometheus_registry(prometheus_baseline: frozenset[Any]):
+    """Remove collectors registered during a test to ensure isolation.
 
     This is necessary for tests that create multiple Flask app instances or services
     that register Prometheus metrics, as metrics cannot be registered twice in the
-    same registry. Clearing before AND after each test ensures proper isolation.
+    same registry. Only collectors added on top of the session baseline are
+    unregistered, so each test leaves the registry as it found it.
     """
-    # Clear collectors before test
-    collectors = list(REGISTRY._collector_to_names.keys())
-    for collector in collectors:
-        try:
-            REGISTRY.unregister(collector)
-        except (KeyError, ValueError):
-            # Collector may have already been unregistered or not exist
-            pass
     yield
-    # Clean up after test
-    collectors = list(REGISTRY._collector_to_names.keys())
-    for collector in collectors:
-        try:
-            REGISTRY.unregister(collector)
-        except (KeyError, ValueError):
-            pass
+    added = REGISTRY._collector_to_names.keys() - prometheus_baseline
+    for collector in added:
+        REGISTRY.unregister(collector)
 
 
 def _build_test_settings() -> Settings:
@@ -172,8 +176,21 @@ def mock_jwks() -> dict[str, Any]:
     }
 
 
+@pytest.fixture(scope="session")
+def jwt_keys() -> tuple[Any, Any]:
+    """Generate the RSA signing key and a wrong key once per session.
+
+    RSA key generation is slow, and the keys carry no per-test state.
+    """
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    wrong_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return private_key, wrong_key
+
+
 @pytest.fixture
-def generate_test_jwt(test_settings: Settings) -> Any:
+def generate_test_jwt(test_settings: Settings, jwt_keys: tuple[Any, Any]) -> Any:
     """Factory fixture to generate test JWT tokens.
 
     Returns a callable that generates JWT tokens with configurable claims.
@@ -182,10 +199,8 @@ def generate_test_jwt(test_settings: Settings) -> Any:
     import time
 
     import jwt
-    from cryptography.hazmat.primitives.asymmetric import rsa
 
-    # Generate RSA keypair for testing
-    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_key, wrong_key = jwt_keys
     public_key = private_key.public_key()
 
     def _generate(
@@ -234,7 +249,7 @@ def generate_test_jwt(test_settings: Settings) -> Any:
             payload["name"] = name
 
         # Use wrong key if invalid_signature requested
-        signing_key = rsa.generate_private_key(public_exponent=65537, key_size=2048) if invalid_signature else private_key
+        signing_key = wrong_key if invalid_signature else private_key
 
         token = jwt.encode(payload, signing_key, algorithm="RS256", headers={"kid": "test-key-id"})
         return token
@@ -246,46 +261,61 @@ def generate_test_jwt(test_settings: Settings) -> Any:
     return _generate
 
 
+@pytest.fixture
+def mock_oidc_provider(
+    mock_oidc_discovery: dict[str, Any],
+    generate_test_jwt: Any,
+) -> Generator[None]:
+    """Mock OIDC discovery (httpx.get) and the JWKS client for AuthService.
+
+    Tokens from generate_test_jwt verify against the mocked signing key while
+    the fixture is active.
+    """
+    with ExitStack() as stack:
+        mock_get = stack.enter_context(patch.object(httpx, "get"))
+        mock_response = MagicMock()
+        mock_response.json.return_value = mock_oidc_discovery
+        mock_response.raise_for_status = MagicMock()
+        mock_get.return_value = mock_response
+
+        mock_jwk_client_class = stack.enter_context(
+            patch.object(auth_service, "PyJWKClient")
+        )
+        mock_jwk_client = MagicMock()
+        mock_signing_key = MagicMock()
+        mock_signing_key.key = generate_test_jwt.public_key
+        mock_jwk_client.get_signing_key_from_jwt.return_value = mock_signing_key
+        mock_jwk_client_class.return_value = mock_jwk_client
+
+        yield
+
+
 @pytest.fixture
 def oidc_app(
     test_settings: Settings,
     test_app_settings: AppSettings,
-    mock_oidc_discovery: dict[str, Any],
-    generate_test_jwt: Any,
+    mock_oidc_provider: None,
 ) -> Generator[Flask]:
     """Create Flask app with OIDC enabled, using the standard template clone pattern.
 
-    Keeps httpx.get and PyJWKClient mocks active so that AuthService can
-    discover endpoints and validate tokens throughout the test.
+    Depends on mock_oidc_provider so that AuthService can discover endpoints
+    and validate tokens throughout the test.
     """
     settings = test_settings.model_copy(update={
         "oidc_enabled": True,
         "oidc_client_secret": "test-secret",
     })
 
-    with patch("httpx.get") as mock_get:
-        mock_response = MagicMock()
-        mock_response.json.return_value = mock_oidc_discovery
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+    app = create_app(settings, app_settings=test_app_settings, skip_background_services=True)
 
-        with patch("app.services.auth_service.PyJWKClient") as mock_jwk_client_class:
-            mock_jwk_client = MagicMock()
-            mock_signing_key = MagicMock()
-            mock_signing_key.key = generate_test_jwt.public_key
-            mock_jwk_client.get_signing_key_from_jwt.return_value = mock_signing_key
-            mock_jwk_client_class.return_value = mock_jwk_client
-
-            app = create_app(settings, app_settings=test_app_settings, skip_background_services=True)
-
-            try:
-                yield app
-            finally:
-                # Shut down all background services via the lifecycle coordinator
-                try:
-                    app.container.lifecycle_coordinator().shutdown()
-                except Exception:
-                    pass
+    try:
+        yield app
+    finally:
+        # Shut down all background services via the lifecycle coordinator
+        try:
+            app.container.lifecycle_coordinator().shutdown()
+        except Exception:
+            pass
 
 
 @pytest.fixture
@@ -0,0 +1,141 @@
+"""Tests for the AuthService validated-token cache."""
+
+from __future__ import annotations
+
+import dataclasses
+import time
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import jwt
+import pytest
+
+from app.config import Settings
+from app.exceptions import AuthenticationException
+from app.services import auth_service
+from app.services.auth_service import AuthService
+
+
+class _Clock:
+    """Stand-in for time.time that tests can move forward."""
+
+    def __init__(self) -> None:
+        self.now = time.time()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def oidc_auth_service(test_settings: Settings, mock_oidc_provider: None) -> AuthService:
+    """AuthService with OIDC enabled against mocked discovery and JWKS."""
+    return AuthService(test_settings.model_copy(update={"oidc_enabled": True}))
+
+
+@pytest.fixture
+def decode_spy() -> Generator[MagicMock]:
+    """Count jwt.decode calls made by AuthService while still decoding."""
+    with patch.object(auth_service.jwt, "decode", wraps=jwt.decode) as spy:
+        yield spy
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    """Drive the wall clock the token cache uses for its deadlines."""
+    fake = _Clock()
+    monkeypatch.setattr(auth_service.time, "time", fake)
+    return fake
+
+
+def _token_with_exp(test_settings: Settings, generate_test_jwt: Any, exp: float) -> str:
+    payload = {
+        "sub": "test-user",
+        "iss": test_settings.oidc_issuer_url,
+        "aud": test_settings.oidc_client_id,
+        "exp": int(exp),
+        "iat": int(time.time()),
+    }
+    return jwt.encode(
+        payload, generate_test_jwt.private_key, algorithm="RS256", headers={"kid": "test-key-id"}
+    )
+
+
+def test_cache_hit_skips_jwt_decoding(oidc_auth_service, generate_test_jwt, decode_spy):
+    token = generate_test_jwt()
+
+    first = oidc_auth_service.validate_token(token)
+    second = oidc_auth_service.validate_token(token)
+
+    assert second is first
+    assert decode_spy.call_count == 1
+
+
+def test_cached_context_cannot_be_mutated(oidc_auth_service, generate_test_jwt):
+    context = oidc_auth_service.validate_token(generate_test_jwt())
+
+    assert isinstance(context.roles, frozenset)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        context.subject = "someone-else"  # type: ignore[misc]
+
+
+def test_cache_entry_expires_after_ttl(oidc_auth_service, generate_test_jwt, decode_spy, clock):
+    # Token is valid for an hour, so the 300s TTL is the earlier deadline
+    token = generate_test_jwt()
+    oidc_auth_service.validate_token(token)
+
+    clock.now += auth_service._TOKEN_CACHE_TTL_SECONDS - 1
+    oidc_auth_service.validate_token(token)
+    assert decode_spy.call_count == 1
+
+    clock.now += 1
+    oidc_auth_service.validate_token(token)
+    assert decode_spy.call_count == 2
+
+
+def test_cache_entry_expires_at_token_exp(
+    oidc_auth_service, test_settings, generate_test_jwt, decode_spy, clock
+):
+    # Token expires well before the TTL, so exp is the earlier deadline
+    exp = int(clock.now) + 60
+    token = _token_with_exp(test_settings, generate_test_jwt, exp)
+    oidc_auth_service.validate_token(token)
+
+    clock.now = exp - 1
+    oidc_auth_service.validate_token(token)
+    assert decode_spy.call_count == 1
+
+    clock.now = exp
+    oidc_auth_service.validate_token(token)
+    assert decode_spy.call_count == 2
+
+
+def test_failed_validation_is_not_cached(oidc_auth_service, generate_test_jwt, decode_spy):
+    token = generate_test_jwt(invalid_signature=True)
+
+    for _ in range(2):
+        with pytest.raises(AuthenticationException):
+            oidc_auth_service.validate_token(token)
+
+    assert decode_spy.call_count == 2
+    assert len(oidc_auth_service._token_cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted_at_capacity(
+    oidc_auth_service, generate_test_jwt, decode_spy, monkeypatch
+):
+    monkeypatch.setattr(auth_service, "_TOKEN_CACHE_MAX_ENTRIES", 2)
+    token_a, token_b, token_c = (generate_test_jwt(subject=s) for s in ("a", "b", "c"))
+
+    oidc_auth_service.validate_token(token_a)
+    oidc_auth_service.validate_token(token_b)
+    oidc_auth_service.validate_token(token_a)  # hit: a becomes most recently used
+    oidc_auth_service.validate_token(token_c)  # evicts b
+    assert decode_spy.call_count == 3
+    assert len(oidc_auth_service._token_cache) == 2
+
+    oidc_auth_service.validate_token(token_a)
+    assert decode_spy.call_count == 3
+
+    oidc_auth_service.validate_token(token_b)
+    assert decode_spy.call_count == 4
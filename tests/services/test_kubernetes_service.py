@@ -4,18 +4,19 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass
-from unittest.mock import MagicMock
 
 import pytest
 from kubernetes.client import ApiException
 
 from app.schemas.config import KubernetesConfig, TabConfig
 from app.schemas.status import StatusState
+from app.services.config_service import ConfigService
 from app.services.kubernetes_service import KubernetesService
 from app.services.tab_status_service import TabStatusService
+from tests.stubs import NullSSE
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _FakeStatus:
     available_replicas: int | None = None
     updated_replicas: int | None = None
@@ -25,24 +26,24 @@ class _FakeStatus:
     conditions: list[object] | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _FakeSpec:
     replicas: int | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _FakeDeployment:
     metadata: object
     status: _FakeStatus
     spec: _FakeSpec
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _FakeMetadata:
     generation: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _FakeCondition:
     type: str
     status: str
@@ -52,6 +53,8 @@ class _FakeCondition:
 
 
 class _FakeAppsApi:
+    __slots__ = ("stream_events", "patched", "list_calls", "status_obj")
+
     def __init__(self, stream_events, status_obj=None):
         self.stream_events = stream_events
         self.patched = []
@@ -78,8 +81,11 @@ class _FakeAppsApi:
 
 
 class _FakeWatch:
+    __slots__ = ("_events", "stopped", "calls")
+
     def __init__(self, events):
-        self._events = list(events)
+        # Aliased, not copied: each test hands the fake its own list
+        self._events = events
         self.stopped = False
         self.calls = []
 
@@ -87,44 +93,47 @@ class _FakeWatch:
         kwargs.setdefault("watch", True)
         func(*args, **kwargs)
         self.calls.append((func, args, kwargs))
-        yield from self._events
+        return iter(self._events)
 
     def stop(self):
         self.stopped = True
 
 
-def _make_tab() -> TabConfig:
-    return TabConfig(
-        text="Code Server",
-        iconUrl="https://example.com/icon-b.svg",
-        iframeUrl="https://example.com/code",
-        k8s=KubernetesConfig(namespace="default", deployment="code-server"),
-    )
-
+# The service only reads the tab, so all tests share one instance
+_TAB = TabConfig(
+    text="Code Server",
+    iconUrl="https://example.com/icon-b.svg",
+    iframeUrl="https://example.com/code",
+    k8s=KubernetesConfig(namespace="default", deployment="code-server"),
+)
 
-def _make_tab_status_service() -> TabStatusService:
-    """Create a TabStatusService with a mocked SSE connection manager."""
-    from app.services.config_service import ConfigService
 
-    tabs = [
+# ConfigService is read-only, so all tests share one instance
+_CONFIG_SERVICE = ConfigService(
+    [
         TabConfig(
             text="Tab",
             iconUrl="https://example.com/icon.svg",
             iframeUrl="https://example.com/tab",
         ),
     ]
-    config_svc = ConfigService(tabs)
-    mock_sse = MagicMock()
-    return TabStatusService(config_svc, mock_sse)
+)
+
+
+def _make_tab_status_service() -> TabStatusService:
+    """Create a TabStatusService with a no-op SSE connection manager."""
+    return TabStatusService(_CONFIG_SERVICE, NullSSE())
 
 
 def _wait_for_idle(service: KubernetesService, timeout: float = 2.0):
-    deadline = time.time() + timeout
-    while time.time() < deadline:
-        if not service._inflight:
-            return
-        time.sleep(0.05)
-    pytest.fail("worker thread did not complete")
+    # Join the worker threads directly instead of polling _inflight
+    with service._lock:
+        workers = list(service._inflight.values())
+    deadline = time.monotonic() + timeout
+    for worker in workers:
+        worker.join(max(0.0, deadline - time.monotonic()))
+        if worker.is_alive():
+            pytest.fail("worker thread did not complete")
 
 
 def test_restart_success_sets_running():
@@ -226,8 +235,7 @@ def test_restart_success_sets_running():
         restart_timeout=2,
     )
 
-    tab = _make_tab()
-    service.request_restart(0, tab)
+    service.request_restart(0, _TAB)
     _wait_for_idle(service)
 
     assert watcher.stopped
@@ -256,8 +264,7 @@ def test_restart_timeout_emits_error():
         restart_timeout=1,
     )
 
-    tab = _make_tab()
-    service.request_restart(0, tab)
+    service.request_restart(0, _TAB)
     _wait_for_idle(service)
 
     assert watcher.stopped
@@ -282,8 +289,7 @@ def test_restart_api_failure_reports_error():
         restart_timeout=1,
     )
 
-    tab = _make_tab()
-    service.request_restart(0, tab)
+    service.request_restart(0, _TAB)
     _wait_for_idle(service)
 
     payload = tab_status_service.current(0)
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import pytest
+from pydantic import ValidationError
 
 from app.schemas.config import TabConfig
 from app.schemas.status import StatusPayload, StatusState
@@ -10,8 +11,25 @@ from app.services.config_service import ConfigService
 from app.services.tab_status_service import TabStatusService
 
 
-def _make_service(tab_count: int = 2) -> tuple[TabStatusService, MagicMock]:
-    """Create a TabStatusService with a mocked SSE connection manager."""
+class _SpySse:
+    """Records the calls TabStatusService makes on the SSE connection manager."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[object, ...]] = []
+        self.on_connect: list[object] = []
+
+    def register_on_connect(self, callback) -> None:
+        self.on_connect.append(callback)
+
+    def send_event(self, request_id, event_data, event_name, service_type) -> None:
+        self.calls.append((request_id, event_data, event_name, service_type))
+
+    def reset(self) -> None:
+        self.calls.clear()
+
+
+def _make_service(tab_count: int = 2) -> tuple[TabStatusService, _SpySse]:
+    """Create a TabStatusService with a recording SSE connection manager."""
     tabs = [
         TabConfig(
             text=f"Tab {i}",
@@ -21,9 +39,9 @@ def _make_service(tab_count: int = 2) -> tuple[TabStatusService, MagicMock]:
         for i in range(tab_count)
     ]
     config_svc = ConfigService(tabs)
-    mock_sse = MagicMock()
-    service = TabStatusService(config_svc, mock_sse)
-    return service, mock_sse
+    spy = _SpySse()
+    service = TabStatusService(config_svc, spy)
+    return service, spy
 
 
 def test_initial_state_is_running():
@@ -34,12 +52,12 @@ def test_initial_state_is_running():
 
 
 def test_emit_updates_state_and_broadcasts():
-    service, mock_sse = _make_service(2)
+    service, spy = _make_service(2)
     payload = StatusPayload(state=StatusState.RESTARTING)
     service.emit(0, payload)
 
     assert service.current(0).state == StatusState.RESTARTING
-    mock_sse.send_event.assert_called_with(
+    assert spy.calls[-1] == (
         None,
         {"tab_index": 0, "state": "restarting", "message": None},
         "tab_status",
@@ -48,13 +66,13 @@ def test_emit_updates_state_and_broadcasts():
 
 
 def test_emit_with_message():
-    service, mock_sse = _make_service(1)
+    service, spy = _make_service(1)
     payload = StatusPayload(state=StatusState.ERROR, message="something broke")
     service.emit(0, payload)
 
     assert service.current(0).state == StatusState.ERROR
     assert service.current(0).message == "something broke"
-    mock_sse.send_event.assert_called_with(
+    assert spy.calls[-1] == (
         None,
         {"tab_index": 0, "state": "error", "message": "something broke"},
         "tab_status",
@@ -63,31 +81,37 @@ def test_emit_with_message():
 
 
 def test_on_client_connect_sends_current_state():
-    service, mock_sse = _make_service(2)
+    service, spy = _make_service(2)
     # Set tab 1 to a non-default state
     service.emit(1, StatusPayload(state=StatusState.ERROR, message="broken"))
-    mock_sse.reset_mock()
+    spy.reset()
 
     # Simulate client connect
     service._on_client_connect("req-123")
 
-    assert mock_sse.send_event.call_count == 2
-    mock_sse.send_event.assert_any_call(
+    assert len(spy.calls) == 2
+    assert (
         "req-123",
         {"tab_index": 0, "state": "running", "message": None},
         "tab_status",
         "status",
-    )
-    mock_sse.send_event.assert_any_call(
+    ) in spy.calls
+    assert (
         "req-123",
         {"tab_index": 1, "state": "error", "message": "broken"},
         "tab_status",
         "status",
-    )
+    ) in spy.calls
 
 
 def test_registers_on_connect_callback():
-    _, mock_sse = _make_service(1)
-    mock_sse.register_on_connect.assert_called_once()
-    callback = mock_sse.register_on_connect.call_args[0][0]
-    assert callable(callback)
+    _, spy = _make_service(1)
+    assert len(spy.on_connect) == 1
+    assert callable(spy.on_connect[0])
+
+
+def test_initial_status_cannot_be_mutated_through_one_tab():
+    service, _ = _make_service(2)
+    with pytest.raises(ValidationError):
+        service.current(0).state = StatusState.ERROR
+    assert service.current(1).state == StatusState.RUNNING
@@ -0,0 +1,193 @@
+"""Tests for TaskService."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+from pydantic import BaseModel
+
+from app.schemas.task_schema import TaskStatus
+from app.services.base_task import BaseTask, ProgressHandle
+from app.services.task_service import TaskService
+from app.utils.lifecycle_coordinator import LifecycleCoordinator
+from tests.stubs import NullSSE
+
+
+class _Result(BaseModel):
+    value: int
+
+
+class _BrokenSSE:
+    """Fails every send, including those outside the task's own error handling."""
+
+    def send_event(self, *args: Any, **kwargs: Any) -> bool:
+        raise RuntimeError("SSE gateway unavailable")
+
+
+class _BlockingTask(BaseTask):
+    """Blocks until released so tests can observe concurrency."""
+
+    def __init__(self, release: threading.Event, started: threading.Semaphore) -> None:
+        super().__init__()
+        self._release = release
+        self._started = started
+
+    def execute(self, progress_handle: ProgressHandle, **kwargs: Any) -> BaseModel:
+        self._started.release()
+        self._release.wait(timeout=5)
+        return _Result(value=kwargs.get("value", 0))
+
+
+class _ValueTask(BaseTask):
+    def execute(self, progress_handle: ProgressHandle, **kwargs: Any) -> BaseModel:
+        return _Result(value=kwargs["value"])
+
+
+def _make_service(
+    max_workers: int = 2, sse: Any = None, cleanup_interval: int = 600
+) -> TaskService:
+    return TaskService(
+        LifecycleCoordinator(graceful_shutdown_timeout=5),
+        sse or NullSSE(),
+        max_workers=max_workers,
+        cleanup_interval=cleanup_interval,
+    )
+
+
+def _wait_for_status(service: TaskService, task_id: str, status: TaskStatus) -> None:
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        info = service.get_task_status(task_id)
+        if info is not None and info.status == status:
+            return
+        time.sleep(0.01)
+    raise AssertionError(f"task {task_id} did not reach {status}")
+
+
+def test_queued_tasks_run_to_completion():
+    service = _make_service(max_workers=2)
+    try:
+        task_ids = [service.start_task(_ValueTask(), value=i).task_id for i in range(10)]
+
+        for i, task_id in enumerate(task_ids):
+            _wait_for_status(service, task_id, TaskStatus.COMPLETED)
+            assert service.get_task_status(task_id).result == {"value": i}
+    finally:
+        service.shutdown()
+
+
+def test_worker_count_is_capped_at_max_workers():
+    service = _make_service(max_workers=2)
+    release = threading.Event()
+    started = threading.Semaphore(0)
+    try:
+        task_ids = [
+            service.start_task(_BlockingTask(release, started)).task_id
+            for _ in range(5)
+        ]
+
+        assert started.acquire(timeout=5)
+        assert started.acquire(timeout=5)
+        assert len(service._workers) == 2
+
+        # Only two tasks can be running; the rest wait in the queue
+        statuses = [service.get_task_status(t).status for t in task_ids]
+        assert statuses.count(TaskStatus.RUNNING) == 2
+        assert statuses.count(TaskStatus.PENDING) == 3
+
+        release.set()
+        for task_id in task_ids:
+            _wait_for_status(service, task_id, TaskStatus.COMPLETED)
+        assert len(service._workers) == 2
+    finally:
+        release.set()
+        service.shutdown()
+
+
+def test_shutdown_drains_queue_and_stops_workers():
+    service = _make_service(max_workers=1)
+    release = threading.Event()
+    started = threading.Semaphore(0)
+    task_ids = [
+        service.start_task(_BlockingTask(release, started)).task_id
+        for _ in range(3)
+    ]
+    assert started.acquire(timeout=5)
+    workers = list(service._workers)
+
+    shutdown = threading.Thread(target=service.shutdown)
+    shutdown.start()
+    release.set()
+    shutdown.join(timeout=5)
+
+    assert not shutdown.is_alive()
+    assert all(not worker.is_alive() for worker in workers)
+    # The stop sentinel is queued behind the pending tasks, so all of them ran
+    assert started.acquire(timeout=0)
+    assert started.acquire(timeout=0)
+    assert all(service.get_task_status(t) is None for t in task_ids)
+
+
+def test_worker_survives_error_escaping_task_execution():
+    service = _make_service(max_workers=1, sse=_BrokenSSE())
+    try:
+        # The failure event broadcast raises outside the task's own try block
+        first = service.start_task(_ValueTask(), value=1).task_id
+        _wait_for_status(service, first, TaskStatus.FAILED)
+
+        second = service.start_task(_ValueTask(), value=2).task_id
+        _wait_for_status(service, second, TaskStatus.FAILED)
+
+        assert len(service._workers) == 1
+        assert service._workers[0].is_alive()
+    finally:
+        service.shutdown()
+
+
+def test_expired_tasks_are_swept_on_next_start():
+    service = _make_service(max_workers=1, cleanup_interval=600)
+    try:
+        first = service.start_task(_ValueTask(), value=1).task_id
+        _wait_for_status(service, first, TaskStatus.COMPLETED)
+
+        # Age out the finished task without sleeping through the interval
+        service.cleanup_interval = 0
+        service.start_task(_ValueTask(), value=2)
+
+        assert service.get_task_status(first) is None
+    finally:
+        service.shutdown()
+
+
+def test_finished_tasks_are_kept_until_cleanup_interval_passes():
+    service = _make_service(max_workers=1, cleanup_interval=600)
+    try:
+        first = service.start_task(_ValueTask(), value=1).task_id
+        _wait_for_status(service, first, TaskStatus.COMPLETED)
+
+        service.start_task(_ValueTask(), value=2)
+
+        assert service.get_task_status(first).status == TaskStatus.COMPLETED
+    finally:
+        service.shutdown()
+
+
+def test_shutdown_stops_waiting_for_stuck_workers_at_deadline():
+    service = _make_service(max_workers=1)
+    release = threading.Event()
+    started = threading.Semaphore(0)
+    service.start_task(_BlockingTask(release, started))
+    assert started.acquire(timeout=5)
+    try:
+        # The lifecycle coordinator hands the waiter its remaining grace period
+        assert service._wait_for_tasks_completion(0.05) is False
+
+        begin = time.monotonic()
+        service.shutdown()
+
+        assert time.monotonic() - begin < 1
+        assert service._workers[0].is_alive()
+    finally:
+        release.set()
@@ -0,0 +1,15 @@
+"""Test doubles shared between test modules."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class NullSSE:
+    """SSE connection manager stand-in that accepts and discards every call."""
+
+    def register_on_connect(self, callback: Any) -> None:
+        pass
+
+    def send_event(self, *args: Any, **kwargs: Any) -> bool:
+        return True
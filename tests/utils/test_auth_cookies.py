@@ -0,0 +1,57 @@
+"""Tests for clearing auth cookies."""
+
+from __future__ import annotations
+
+from flask import Response
+
+from app.config import Settings
+from app.utils.auth import clear_auth_cookies
+
+
+def _cleared_cookies(config: Settings) -> dict[str, str]:
+    response = Response()
+    clear_auth_cookies(response, config)
+    return {
+        header.partition("=")[0]: header
+        for header in response.headers.getlist("Set-Cookie")
+    }
+
+
+def test_expires_all_auth_cookies(test_settings: Settings):
+    cookies = _cleared_cookies(test_settings)
+
+    assert set(cookies) == {
+        test_settings.oidc_cookie_name,
+        test_settings.oidc_refresh_cookie_name,
+        "id_token",
+    }
+    for header in cookies.values():
+        assert "Max-Age=0" in header
+        assert "Expires=Thu, 01 Jan 1970 00:00:00 GMT" in header
+        assert "HttpOnly" in header
+
+
+def test_uses_configured_cookie_flags(test_settings: Settings):
+    config = test_settings.model_copy(update={
+        "oidc_cookie_secure": True,
+        "oidc_cookie_samesite": "None",
+        "oidc_cookie_partitioned": True,
+    })
+
+    for header in _cleared_cookies(config).values():
+        assert "Secure" in header
+        assert "SameSite=None" in header
+        assert "Partitioned" in header
+
+
+def test_omits_flags_that_are_disabled(test_settings: Settings):
+    config = test_settings.model_copy(update={
+        "oidc_cookie_secure": False,
+        "oidc_cookie_samesite": "Strict",
+        "oidc_cookie_partitioned": False,
+    })
+
+    for header in _cleared_cookies(config).values():
+        assert "Secure" not in header
+        assert "SameSite=Strict" in header
+        assert "Partitioned" not in header
@@ -0,0 +1,37 @@
+"""Tests for extracting the JWT from a request."""
+
+from __future__ import annotations
+
+import pytest
+from flask import Flask
+
+from app.config import Settings
+from app.utils.auth import extract_token_from_request
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("Bearer abc.def.ghi", "abc.def.ghi"),
+        ("bearer abc.def.ghi", "abc.def.ghi"),
+        ("Bearer\tabc.def.ghi", "abc.def.ghi"),
+        ("Bearer   abc.def.ghi  ", "abc.def.ghi"),
+        ("Bearer abc.def\tghi", None),
+        ("Bearer abc def", None),
+        ("Bearer", None),
+        ("Basic dXNlcjpwdw==", None),
+    ],
+)
+def test_bearer_header_parsing(test_settings: Settings, header: str, expected: str | None):
+    with Flask(__name__).test_request_context(headers={"Authorization": header}):
+        assert extract_token_from_request(test_settings) == expected
+
+
+def test_cookie_takes_precedence_over_header(test_settings: Settings):
+    with Flask(__name__).test_request_context(
+        headers={
+            "Authorization": "Bearer from-header",
+            "Cookie": f"{test_settings.oidc_cookie_name}=from-cookie",
+        }
+    ):
+        assert extract_token_from_request(test_settings) == "from-cookie"
@@ -0,0 +1,63 @@
+"""Tests for validate_redirect_url."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.exceptions import ValidationException
+from app.utils.auth import validate_redirect_url
+
+_BASE_URL = "https://app.example.com"
+
+
+def test_plain_path_is_allowed():
+    validate_redirect_url("/tabs/1?x=1#top", _BASE_URL)
+
+
+def test_relative_path_is_allowed():
+    validate_redirect_url("tabs/1", _BASE_URL)
+
+
+def test_scheme_relative_url_is_rejected():
+    with pytest.raises(ValidationException):
+        validate_redirect_url("//evil.com/path", _BASE_URL)
+
+
+def test_percent_encoded_slashes_stay_a_path():
+    validate_redirect_url("/%2F%2Fevil.com", _BASE_URL)
+
+
+def test_backslash_paths_have_no_host():
+    # urlparse sees no netloc in either form, matching the original check
+    validate_redirect_url("/\\evil.com", _BASE_URL)
+    validate_redirect_url("\\/evil.com", _BASE_URL)
+
+
+@pytest.mark.parametrize("separator", ["\t", "\r\n", "\n"])
+def test_control_characters_cannot_smuggle_a_host(separator: str):
+    # urlparse removes tab, CR and LF, turning "/<sep>/evil.com" into "//evil.com"
+    with pytest.raises(ValidationException):
+        validate_redirect_url(f"/{separator}/evil.com", _BASE_URL)
+
+
+def test_trailing_newline_on_a_path_is_allowed():
+    validate_redirect_url("/tabs\r\n", _BASE_URL)
+
+
+def test_absolute_url_on_base_origin_is_allowed():
+    validate_redirect_url("https://app.example.com/tabs", _BASE_URL)
+
+
+@pytest.mark.parametrize(
+    "redirect_url",
+    [
+        "https://evil.com/tabs",
+        "http://app.example.com/tabs",
+        "https://app.example.com:8443/tabs",
+        "https://app.example.com@evil.com/",
+        "javascript:alert(1)",
+    ],
+)
+def test_absolute_url_on_other_origin_is_rejected(redirect_url: str):
+    with pytest.raises(ValidationException):
+        validate_redirect_url(redirect_url, _BASE_URL)
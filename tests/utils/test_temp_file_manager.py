@@ -0,0 +1,57 @@
+"""Tests for TempFileManager."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from app.utils import temp_file_manager
+from app.utils.lifecycle_coordinator import LifecycleCoordinator
+from app.utils.temp_file_manager import TempFileManager
+
+
+def _make_manager(tmp_path: Path) -> TempFileManager:
+    return TempFileManager(LifecycleCoordinator(graceful_shutdown_timeout=5), base_path=str(tmp_path))
+
+
+def test_cache_round_trip(tmp_path: Path):
+    manager = _make_manager(tmp_path)
+    assert manager.cache("https://example.com/a.png", b"png-bytes", "image/png")
+
+    # A fresh manager has an empty memory cache, so this reads from disk
+    cached = _make_manager(tmp_path).get_cached("https://example.com/a.png")
+
+    assert cached is not None
+    assert cached.content == b"png-bytes"
+    assert cached.content_type == "image/png"
+
+
+def test_cleanup_removes_legacy_cache_files(tmp_path: Path):
+    manager = _make_manager(tmp_path)
+    manager.cache("https://example.com/a.png", b"png-bytes", "image/png")
+    (tmp_path / "0123abcd.bin").write_bytes(b"old content")
+    (tmp_path / "0123abcd.json").write_text("{}")
+
+    manager.cleanup_old_files()
+
+    assert not (tmp_path / "0123abcd.bin").exists()
+    assert not (tmp_path / "0123abcd.json").exists()
+    assert manager.get_cached("https://example.com/a.png") is not None
+    assert len(list(tmp_path.glob("*.cache"))) == 1
+
+
+def test_memory_cache_is_bounded_by_total_size(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(temp_file_manager, "_MEMORY_CACHE_MAX_BYTES", 10)
+    manager = _make_manager(tmp_path)
+
+    manager.cache("https://example.com/a", b"aaaa", "text/plain")
+    manager.cache("https://example.com/b", b"bbbb", "text/plain")
+    manager.get_cached("https://example.com/a")  # a becomes most recently used
+    manager.cache("https://example.com/c", b"cccc", "text/plain")  # evicts b
+
+    assert manager._memory_cache_bytes == 8
+    assert [c.content for c in manager._memory_cache.values()] == [b"aaaa", b"cccc"]
+
+    # Entries larger than the budget are not held in memory but still cached
+    manager.cache("https://example.com/big", b"x" * 11, "text/plain")
+    assert manager._memory_cache_bytes == 8
+    assert manager.get_cached("https://example.com/big").content == b"x" * 11
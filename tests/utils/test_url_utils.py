@@ -0,0 +1,68 @@
+"""Tests for URL utilities."""
+
+from __future__ import annotations
+
+from app.utils.url_utils import get_filename_from_url
+
+_DEFAULT = "Untitled"
+
+
+def test_returns_last_path_segment():
+    assert get_filename_from_url("https://example.com/files/report.pdf", _DEFAULT) == "report.pdf"
+
+
+def test_ignores_query_string():
+    url = "https://example.com/files/report.pdf?next=/other/file.txt"
+    assert get_filename_from_url(url, _DEFAULT) == "report.pdf"
+
+
+def test_ignores_fragment():
+    url = "https://example.com/files/report.pdf#frag/x.txt"
+    assert get_filename_from_url(url, _DEFAULT) == "report.pdf"
+
+
+def test_ignores_path_parameters():
+    url = "https://example.com/dir/file.txt;type=a"
+    assert get_filename_from_url(url, _DEFAULT) == "file.txt"
+
+
+def test_trailing_slash_falls_back_to_default():
+    assert get_filename_from_url("https://example.com/files/", _DEFAULT) == _DEFAULT
+
+
+def test_keeps_percent_encoding():
+    url = "https://example.com/a%2Fmy%20report.pdf"
+    assert get_filename_from_url(url, _DEFAULT) == "a%2Fmy%20report.pdf"
+
+
+def test_url_without_path_falls_back_to_default():
+    assert get_filename_from_url("https://example.com", _DEFAULT) == _DEFAULT
+    assert get_filename_from_url("https://example.com?q=/a.txt", _DEFAULT) == _DEFAULT
+    assert get_filename_from_url("//cdn.example.com#/a.txt", _DEFAULT) == _DEFAULT
+
+
+def test_userinfo_and_port_are_not_part_of_the_path():
+    assert get_filename_from_url("https://user:pw@example.com:8443/dir/file.zip", _DEFAULT) == "file.zip"
+    assert get_filename_from_url("https://user@example.com:8443", _DEFAULT) == _DEFAULT
+
+
+def test_scheme_relative_url():
+    assert get_filename_from_url("//cdn.example.com/img/logo.svg", _DEFAULT) == "logo.svg"
+
+
+def test_relative_path():
+    assert get_filename_from_url("relative/image.png", _DEFAULT) == "image.png"
+
+
+def test_scheme_without_authority_is_dropped():
+    assert get_filename_from_url("mailto:someone@example.com", _DEFAULT) == "someone@example.com"
+
+
+def test_tabs_and_newlines_are_removed():
+    url = "https://exa\tmple.com/fi\r\nle.txt"
+    assert get_filename_from_url(url, _DEFAULT) == "file.txt"
+
+
+def test_leading_whitespace_and_controls_are_stripped():
+    assert get_filename_from_url(" \x00https://example.com", _DEFAULT) == _DEFAULT
+    assert get_filename_from_url("\n//example.com/a.txt", _DEFAULT) == "a.txt"